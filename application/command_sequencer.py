@@ -3,6 +3,8 @@ from typing import List, Callable, Optional
 from dataclasses import dataclass
 import time
 
+from application.event_log import get_event_log
+
 
 @dataclass
 class Command:
@@ -19,7 +21,7 @@ class Command:
                 time.sleep(self.delay_after)
             return result
         except Exception as e:
-            print(f"Command '{self.name}' failed: {e}")
+            get_event_log().error("sequencer", "Command '%s' failed: %s", self.name, e)
             return False
 
 
@@ -34,18 +36,19 @@ class CommandSequence:
     
     def execute_all(self) -> bool:
         """Execute all commands in sequence"""
-        print(f"Executing sequence: {self.name}")
+        events = get_event_log()
+        events.info("sequencer", "Executing sequence: %s", self.name)
         
         for i, command in enumerate(self.commands):
             self.current_index = i
-            print(f"  [{i+1}/{len(self.commands)}] Executing: {command.name}")
+            events.debug("sequencer", "[%d/%d] Executing: %s", i + 1, len(self.commands), command.name)
             
             if not command.execute():
-                print(f"  Sequence '{self.name}' failed at step {i+1}")
+                events.warning("sequencer", "Sequence '%s' failed at step %d", self.name, i + 1)
                 return False
         
         self.completed = True
-        print(f"Sequence '{self.name}' completed successfully")
+        events.info("sequencer", "Sequence '%s' completed successfully", self.name)
         return True
     
     def reset(self):
@@ -68,7 +71,7 @@ class CommandSequencer:
     def execute_sequence(self, sequence_name: str) -> bool:
         """Execute a registered sequence by name"""
         if sequence_name not in self.sequences:
-            print(f"Unknown sequence: {sequence_name}")
+            get_event_log().warning("sequencer", "Unknown sequence: %s", sequence_name)
             return False
         
         self.current_sequence = self.sequences[sequence_name]
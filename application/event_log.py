@@ -0,0 +1,194 @@
+"""Low-overhead structured event log for the control path"""
+from enum import IntEnum
+from typing import Optional, TextIO
+import atexit
+import sys
+import threading
+import time
+
+
+# Standard logging level names that have no EventLevel of their own
+_LEVEL_ALIASES = {
+    'NOTSET': 'DEBUG',
+    'WARN': 'WARNING',
+    'CRITICAL': 'ERROR',
+    'FATAL': 'ERROR',
+}
+
+
+class EventLevel(IntEnum):
+    """Event severity, ordered for threshold filtering"""
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+    @classmethod
+    def parse(cls, name: str) -> "EventLevel":
+        """Map a config string such as 'INFO' (or any logging level name) to a level"""
+        key = name.strip().upper()
+        try:
+            return cls[_LEVEL_ALIASES.get(key, key)]
+        except KeyError:
+            raise ValueError(f"Unknown log level: {name}")
+
+
+class EventLog:
+    """Ring buffer of event records drained by a background writer
+
+    Producers only store a timestamp, level, source, format string and the
+    raw arguments into a preallocated slot; %-formatting and console I/O
+    happen on the writer thread. Events below ``level`` return before
+    touching the buffer. When the ring is full new events are dropped and
+    counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        level: EventLevel = EventLevel.INFO,
+        capacity: int = 1024,
+        stream: Optional[TextIO] = None,
+        flush_interval: float = 0.05,
+    ):
+        self.level = level
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.stream = stream
+        self.dropped = 0
+
+        # Slot layout: [timestamp, level, source, fmt, args]
+        self._slots = [[0.0, EventLevel.DEBUG, "", "", ()] for _ in range(capacity)]
+        self._head = 0  # Next slot to write
+        self._tail = 0  # Next slot to drain
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = False
+        self._writer: Optional[threading.Thread] = None
+
+    def enabled(self, level: EventLevel) -> bool:
+        """Check if events at this level are recorded"""
+        return level >= self.level
+
+    def debug(self, source: str, fmt: str, *args):
+        """Record a DEBUG event"""
+        if EventLevel.DEBUG >= self.level:
+            self._record(EventLevel.DEBUG, source, fmt, args)
+
+    def info(self, source: str, fmt: str, *args):
+        """Record an INFO event"""
+        if EventLevel.INFO >= self.level:
+            self._record(EventLevel.INFO, source, fmt, args)
+
+    def warning(self, source: str, fmt: str, *args):
+        """Record a WARNING event"""
+        if EventLevel.WARNING >= self.level:
+            self._record(EventLevel.WARNING, source, fmt, args)
+
+    def error(self, source: str, fmt: str, *args):
+        """Record an ERROR event and wake the writer"""
+        if EventLevel.ERROR >= self.level:
+            self._record(EventLevel.ERROR, source, fmt, args)
+            self._wakeup.set()
+
+    def _record(self, level: EventLevel, source: str, fmt: str, args: tuple):
+        """Store an event into the next free slot"""
+        timestamp = time.time()
+        with self._lock:
+            if self._head - self._tail >= self.capacity:
+                self.dropped += 1
+                return
+            slot = self._slots[self._head % self.capacity]
+            slot[0] = timestamp
+            slot[1] = level
+            slot[2] = source
+            slot[3] = fmt
+            slot[4] = args
+            self._head += 1
+
+    def start(self):
+        """Start the background writer thread"""
+        if self._running:
+            return
+        self._running = True
+        self._writer = threading.Thread(target=self._run, name="event-log-writer", daemon=True)
+        self._writer.start()
+
+    def close(self):
+        """Stop the writer and drain any remaining events"""
+        if self._running:
+            self._running = False
+            self._wakeup.set()
+            self._writer.join()
+        self.drain()
+
+    def _run(self):
+        """Writer thread body"""
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.drain()
+
+    def drain(self) -> int:
+        """
+        Format and write all pending events
+
+        Returns:
+            Number of events written
+        """
+        with self._lock:
+            pending = []
+            while self._tail < self._head:
+                slot = self._slots[self._tail % self.capacity]
+                pending.append((slot[0], slot[1], slot[2], slot[3], slot[4]))
+                slot[4] = ()  # Release argument references
+                self._tail += 1
+            dropped, self.dropped = self.dropped, 0
+
+        if not pending and not dropped:
+            return 0
+
+        lines = [self._format(*event) for event in pending]
+        if dropped:
+            lines.append(f"{self._timestamp(time.time())} WARNING [event_log] {dropped} events dropped")
+
+        stream = self.stream or sys.stdout
+        try:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+        except Exception:
+            pass
+        return len(pending)
+
+    def _format(self, timestamp: float, level: EventLevel, source: str, fmt: str, args: tuple) -> str:
+        """Render one event as a console line"""
+        try:
+            message = fmt % args if args else fmt
+        except Exception:
+            message = f"{fmt} {args!r}"
+        return f"{self._timestamp(timestamp)} {level.name:<7} [{source}] {message}"
+
+    @staticmethod
+    def _timestamp(timestamp: float) -> str:
+        return time.strftime("%H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+
+
+_event_log: Optional[EventLog] = None
+
+
+def get_event_log() -> EventLog:
+    """Get the shared application event log, starting it on first use"""
+    global _event_log
+    if _event_log is None:
+        from config.constants import APP_CONFIG
+
+        level_name = 'DEBUG' if APP_CONFIG['debug_mode'] else APP_CONFIG['log_level']
+        try:
+            level = EventLevel.parse(level_name)
+        except ValueError:
+            level = None
+        _event_log = EventLog(level=EventLevel.INFO if level is None else level)
+        _event_log.start()
+        atexit.register(_event_log.close)
+        if level is None:
+            _event_log.warning("event_log", "Unknown log level %r, using INFO", level_name)
+    return _event_log
@@ -0,0 +1,88 @@
+"""Decision-stage smoothing between gesture classifier and grip actuator"""
+from collections import deque
+from typing import Deque, Optional
+import math
+import time
+
+from application.grip_controller import GripType
+
+
+class GestureFilter:
+    """Debounces per-window grip decisions into actual state changes
+
+    Combines three filters:
+      - Majority vote over the last ``window_size`` decisions
+      - Hysteresis: the winning grip must hold ``vote_threshold`` of the
+        window before the filter switches away from the current grip
+      - Minimum dwell time between emitted changes
+    """
+
+    def __init__(
+        self,
+        window_size: int = 5,
+        vote_threshold: float = 0.6,
+        min_dwell_time: float = 0.3,
+        initial_grip: GripType = GripType.REST,
+    ):
+        if window_size < 1:
+            raise ValueError(f"window_size must be >= 1, got {window_size}")
+        if not 0.5 < vote_threshold <= 1.0:
+            raise ValueError(f"vote_threshold must be in (0.5, 1.0], got {vote_threshold}")
+
+        self.window_size = window_size
+        self.vote_threshold = vote_threshold
+        self.min_dwell_time = min_dwell_time
+        self.required_votes = math.ceil(window_size * vote_threshold)
+
+        self.decisions: Deque[Optional[GripType]] = deque(maxlen=window_size)
+        self.current_grip = initial_grip
+        self.last_change_time = float("-inf")
+
+    def update(self, decision: Optional[GripType], now: Optional[float] = None) -> Optional[GripType]:
+        """
+        Feed one classifier decision into the filter
+
+        Args:
+            decision: Grip decided for this window, or None for hold
+            now: Monotonic timestamp in seconds (defaults to time.monotonic())
+
+        Returns:
+            The new grip if the filtered state changed, otherwise None
+        """
+        self.decisions.append(decision)
+
+        leader = self._majority()
+        if leader is None or leader == self.current_grip:
+            return None
+
+        if now is None:
+            now = time.monotonic()
+        if now - self.last_change_time < self.min_dwell_time:
+            return None
+
+        self.current_grip = leader
+        self.last_change_time = now
+        return leader
+
+    def _majority(self) -> Optional[GripType]:
+        """Return the grip holding enough votes to switch state, if any"""
+        counts: dict[GripType, int] = {}
+        for decision in self.decisions:
+            if decision is not None:
+                counts[decision] = counts.get(decision, 0) + 1
+
+        for grip, count in counts.items():
+            if count >= self.required_votes:
+                return grip
+        return None
+
+    def reset(self, grip: Optional[GripType] = None):
+        """Clear vote history, optionally resyncing to the actuator's grip"""
+        self.decisions.clear()
+        if grip is not None:
+            self.current_grip = grip
+        self.last_change_time = float("-inf")
+
+    def get_current_grip(self) -> GripType:
+        """Get filtered grip state"""
+        return self.current_grip
@@ -1,5 +1,7 @@
 from enum import Enum
+from typing import Optional
 from application.hardware import HardwareInterface
+from application.event_log import get_event_log
 
 
 class GripState(Enum):
@@ -23,6 +25,9 @@ class GripController:
         self.hardware = hardware
         self.state = GripState.IDLE
         self.current_grip = GripType.REST
+        self.confirmed_grip = GripType.REST  # last grip known to be written
+        self.pending_ticket = 0  # 0 when no grip command is in flight
+        self.events = get_event_log()
        
     def execute_grip(self, grip_type: GripType) -> bool:
         """
@@ -32,7 +37,8 @@ class GripController:
             grip_type: Target grip configuration
            
         Returns:
-            True if execution succeeded
+            True if the command was queued; poll_motion() or
+            wait_for_motion() report whether it was written
         """
         # Pre-check safety constraints
         if not self._check_safety():
@@ -41,12 +47,13 @@ class GripController:
         self.state = GripState.OPENING if grip_type != GripType.REST else GripState.CLOSING
        
         try:
-            # Direct Rust call (no IPC!)
-            self.hardware.maestro.move_to_grip(grip_type.value)
+            # Direct Rust call (no IPC!) - queued, written by the flush thread
+            self.pending_ticket = self.hardware.maestro.move_to_grip(grip_type.value)
             self.current_grip = grip_type
             self.state = GripState.HOLDING
             return True
         except Exception as e:
+            self.events.error("grip", "Grip command failed: %s", e)
             self.state = GripState.IDLE
             return False
            
@@ -56,20 +63,82 @@ class GripController:
             bms_status = self.hardware.bms.get_status()
            
             if not bms_status.is_healthy:
-                print("BMS reports unhealthy state")
+                self.events.warning("grip", "BMS reports unhealthy state")
                 return False
             if bms_status.voltage < 7.0:  # Critical voltage
-                print(f"Battery voltage critical: {bms_status.voltage}V")
+                self.events.warning("grip", "Battery voltage critical: %.2fV", bms_status.voltage)
                 return False
             if bms_status.temperature > 60.0:  # Thermal limit
-                print(f"Battery temperature too high: {bms_status.temperature}°C")
+                self.events.warning("grip", "Battery temperature too high: %.1f°C", bms_status.temperature)
                 return False
             
             return True
         except Exception as e:
-            print(f"Safety check error: {e}")
+            self.events.error("grip", "Safety check error: %s", e)
             return False
     
+    def poll_motion(self) -> Optional[bool]:
+        """
+        Check the in-flight grip command without blocking
+        
+        Returns:
+            None if nothing was resolved, True once the command was written,
+            False if the write failed (current grip reverts)
+        """
+        if not self.pending_ticket:
+            return None
+        try:
+            if not self.hardware.maestro.is_done(self.pending_ticket):
+                return None
+        except Exception as e:
+            self._motion_failed(e)
+            return False
+        self._motion_sent()
+        return True
+    
+    def wait_for_motion(self, timeout: float = 1.0) -> bool:
+        """Block until the last grip command has been written; False on timeout or failure"""
+        if not self.pending_ticket:
+            return True
+        try:
+            if not self.hardware.maestro.wait(self.pending_ticket, timeout):
+                return False
+        except Exception as e:
+            self._motion_failed(e)
+            return False
+        self._motion_sent()
+        return True
+    
+    def restore_grip(self, timeout: float = 1.0) -> bool:
+        """
+        Re-send the last confirmed grip and wait for it to be written
+        
+        Used as a probe that the servo bus works again after a write error.
+        
+        Returns:
+            True if the write went through
+        """
+        self.current_grip = self.confirmed_grip
+        try:
+            self.pending_ticket = self.hardware.maestro.move_to_grip(self.confirmed_grip.value)
+        except Exception as e:
+            self.events.error("grip", "Grip command failed: %s", e)
+            return False
+        if self.wait_for_motion(timeout):
+            self.state = GripState.HOLDING
+            return True
+        return False
+    
+    def _motion_sent(self):
+        self.confirmed_grip = self.current_grip
+        self.pending_ticket = 0
+    
+    def _motion_failed(self, error: Exception):
+        self.events.error("grip", "Servo write error: %s", error)
+        self.current_grip = self.confirmed_grip
+        self.state = GripState.IDLE
+        self.pending_ticket = 0
+    
     def get_current_grip(self) -> GripType:
         """Get current grip type"""
         return self.current_grip
@@ -1,17 +1,44 @@
 """Single initialization point for all hardware interfaces"""
-from gpm import Maestro, Emg, Bms, Fsr
 from config.constants import HARDWARE_CONFIG
+from application.event_log import get_event_log
 
 
 class HardwareInterface:
     """Wrapper to manage all hardware initialization and lifecycle"""
    
-    def __init__(self, config: dict = None):
+    def __init__(self, config: dict = None, clock=None):
         self.config = config or HARDWARE_CONFIG
+        self.sim = None
+        
+        if self.config.get('backend', 'native') == 'sim':
+            # Imported lazily so simulation runs without the Rust extension
+            from application.simulation import SimulatedHardware, SimParams
+            
+            self.sim = SimulatedHardware(
+                seed=self.config.get('sim_seed', 0),
+                clock=clock,
+                params=SimParams.from_overrides({
+                    'emg_sample_rate': self.config.get('emg_sample_rate', 1000),
+                    **self.config.get('sim_params', {}),
+                }),
+            )
+            self.maestro = self.sim.maestro
+            self.emg = self.sim.emg
+            self.bms = self.sim.bms
+            self.fsr = self.sim.fsr
+            self.interlock = self.sim.interlock
+            return
+        
+        from gpm import Maestro, Emg, Bms, Fsr, StateCell
+        
         self.maestro = Maestro()
         self.emg = Emg()
         self.bms = Bms()
         self.fsr = Fsr()
+        
+        # Arm state shared with native code; servo bus failures trip it to ERROR
+        self.interlock = StateCell()
+        self.maestro.attach_interlock(self.interlock)
        
     def initialize(self):
         """Initialize all hardware with config"""
@@ -44,6 +71,7 @@ class HardwareInterface:
                 'charge_percentage': bms_status.charge_percentage,
             },
             'emg_ready': self.emg.is_ready(),
+            'servo_positions': self.maestro.positions(),
         }
     
     def shutdown(self):
@@ -51,6 +79,8 @@ class HardwareInterface:
         # Move servos to rest position
         try:
             self.maestro.move_to_grip("rest")
+            if not self.maestro.flush(timeout=1.0):
+                get_event_log().warning("hardware", "Timed out waiting for rest position to be sent")
         except Exception as e:
-            print(f"Error moving to rest position: {e}")
+            get_event_log().error("hardware", "Error moving to rest position: %s", e)
 
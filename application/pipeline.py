@@ -0,0 +1,357 @@
+"""Multiprocess pipeline: real-time control process plus UI/recording consumers"""
+from multiprocessing import shared_memory
+from typing import Any, Iterable, List, Optional, Tuple
+import csv
+import multiprocessing
+import os
+import signal
+import struct
+import sys
+import threading
+
+from application.event_log import get_event_log
+from config.constants import PIPELINE_CONFIG
+
+
+# Field order of every telemetry record published by the control process
+TELEMETRY_FIELDS = (
+    'timestamp',
+    'state',
+    'grip',
+    'gesture',
+    'voltage',
+    'current',
+    'temperature',
+    'charge_percentage',
+    'is_healthy',
+    'loop_time',
+    'emg_ready',
+)
+
+
+class SharedRing:
+    """Lossy single-producer/single-consumer ring of float64 records in shared memory
+
+    The creating process owns (and unlinks) the segment; other processes
+    attach with its ``handle()``. The producer never blocks: when the
+    consumer falls behind, or briefly holds the lock, new records are
+    dropped and counted.
+
+    The head/tail counters are only touched under a process-shared lock.
+    Its acquire/release pair orders the record bytes against the counters,
+    which plain struct writes to shared memory do not on weakly ordered
+    CPUs. Record bytes are copied outside the lock: a slot is only written
+    while it is free and only read once published.
+    """
+
+    # head, tail, capacity, num_fields
+    HEADER = struct.Struct("<QQII")
+    _COUNTER = struct.Struct("<Q")
+
+    def __init__(
+        self,
+        num_fields: int = len(TELEMETRY_FIELDS),
+        capacity: int = 1024,
+        name: Optional[str] = None,
+        lock=None,
+    ):
+        if name is None:
+            self.record = struct.Struct("<" + "d" * num_fields)
+            size = self.HEADER.size + capacity * self.record.size
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.HEADER.pack_into(self.shm.buf, 0, 0, 0, capacity, num_fields)
+            self.owner = True
+            # Spawn-context lock so spawned consumers can inherit it
+            self.lock = lock if lock is not None else multiprocessing.get_context('spawn').Lock()
+        else:
+            if lock is None:
+                raise ValueError("Attaching to a ring needs its lock, see SharedRing.handle()")
+            self.shm = shared_memory.SharedMemory(name=name)
+            _, _, capacity, num_fields = self.HEADER.unpack_from(self.shm.buf, 0)
+            self.record = struct.Struct("<" + "d" * num_fields)
+            self.owner = False
+            self.lock = lock
+
+        self.capacity = capacity
+        self.num_fields = num_fields
+        self.dropped = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def handle(self) -> Tuple[str, Any]:
+        """(name, lock) to pass to a child process for attach()"""
+        return self.shm.name, self.lock
+
+    @classmethod
+    def attach(cls, handle: Tuple[str, Any]) -> "SharedRing":
+        """Attach to a ring created by another process"""
+        name, lock = handle
+        return cls(name=name, lock=lock)
+
+    def push(self, values: Iterable[float]) -> bool:
+        """
+        Append a record (producer side)
+
+        Returns:
+            False if the ring was full or locked by the consumer and the
+            record was dropped
+        """
+        if not self.lock.acquire(False):
+            self.dropped += 1
+            return False
+        try:
+            buf = self.shm.buf
+            head, tail = self.HEADER.unpack_from(buf, 0)[:2]
+            if head - tail >= self.capacity:
+                self.dropped += 1
+                return False
+            offset = self.HEADER.size + (head % self.capacity) * self.record.size
+            self.record.pack_into(buf, offset, *values)
+            # Publish only after the record is fully written
+            self._COUNTER.pack_into(buf, 0, head + 1)
+            return True
+        finally:
+            self.lock.release()
+
+    def pop_all(self) -> List[tuple]:
+        """Remove and return every pending record (consumer side)"""
+        buf = self.shm.buf
+        with self.lock:
+            head, tail = self.HEADER.unpack_from(buf, 0)[:2]
+        records = []
+        for index in range(tail, head):
+            offset = self.HEADER.size + (index % self.capacity) * self.record.size
+            records.append(self.record.unpack_from(buf, offset))
+        if records:
+            # Free the slots only after they have been copied out
+            with self.lock:
+                self._COUNTER.pack_into(buf, self._COUNTER.size, head)
+        return records
+
+    def close(self):
+        """Detach, unlinking the segment if this process created it"""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def configure_realtime(cpu: Optional[int] = None, priority: Optional[int] = None):
+    """
+    Pin the calling process to a core and raise it to SCHED_FIFO where supported
+
+    Args:
+        cpu: Core index to pin to (None leaves affinity unchanged)
+        priority: SCHED_FIFO priority 1-99 (None leaves the scheduler unchanged)
+    """
+    events = get_event_log()
+
+    if cpu is not None:
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {cpu})
+                events.info("pipeline", "Control process pinned to CPU %d", cpu)
+            except OSError as e:
+                events.warning("pipeline", "Could not pin to CPU %d: %s", cpu, e)
+        else:
+            events.warning("pipeline", "CPU affinity not supported on this platform")
+
+    if priority is not None:
+        if hasattr(os, 'sched_setscheduler'):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                events.info("pipeline", "Control process running SCHED_FIFO priority %d", priority)
+            except (OSError, PermissionError) as e:
+                events.warning("pipeline", "Could not set real-time priority %d: %s", priority, e)
+        else:
+            events.warning("pipeline", "Real-time scheduling not supported on this platform")
+
+
+def _stop_on_event(stop_event, controller):
+    """Clear the controller's run flag once the parent requests a stop"""
+    stop_event.wait()
+    controller.running = False
+
+
+def control_process_main(sink_handles: List[tuple], stop_event, config: Optional[dict], cpu: Optional[int], priority: Optional[int]):
+    """Entry point of the acquisition/DSP/actuation process
+
+    Exits with status 1 if initialization fails, the loop crashes or the
+    arm ends up latched in ERROR.
+    """
+    # Ctrl+C reaches every process; shutdown is coordinated by the parent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from main import ArmController
+    from application.state_machine import ArmState
+
+    events = get_event_log()
+    configure_realtime(cpu, priority)
+
+    sinks: List[SharedRing] = []
+    controller = None
+    failed = True
+    try:
+        sinks.extend(SharedRing.attach(handle) for handle in sink_handles)
+        controller = ArmController(config)
+        # ArmController installs its own Ctrl+C handler
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        controller.telemetry = sinks
+
+        threading.Thread(target=_stop_on_event, args=(stop_event, controller), daemon=True).start()
+
+        if controller.initialize():
+            controller.process_emg_stream()
+            failed = controller.state_machine.get_state() is ArmState.ERROR
+    except Exception as e:
+        events.error("pipeline", "Control process failed: %s", e)
+    finally:
+        for sink in sinks:
+            sink.close()
+        if controller is not None:
+            try:
+                controller.close()
+            except Exception as e:
+                events.error("pipeline", "Control process cleanup failed: %s", e)
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+def recorder_process_main(ring_handle: tuple, stop_event, path: str, poll_interval: float):
+    """Entry point of the telemetry recorder process: appends records to CSV"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    ring = SharedRing.attach(ring_handle)
+    try:
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(TELEMETRY_FIELDS)
+            while not stop_event.is_set():
+                writer.writerows(ring.pop_all())
+                f.flush()
+                stop_event.wait(poll_interval)
+            writer.writerows(ring.pop_all())
+    finally:
+        ring.close()
+
+
+def dashboard_process_main(ring_handle: tuple, stop_event, host: str, port: int, poll_interval: float):
+    """Entry point of the web dashboard process"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from ui.web_dashboard import run_dashboard, publish_telemetry
+
+    ring = SharedRing.attach(ring_handle)
+    try:
+        # Flask has no clean stop hook, so serve from a daemon thread
+        threading.Thread(
+            target=run_dashboard,
+            kwargs={'host': host, 'port': port, 'telemetry': True},
+            daemon=True,
+        ).start()
+        # Drain continuously so the ring never fills up between requests
+        while not stop_event.wait(poll_interval):
+            records = ring.pop_all()
+            if records:
+                publish_telemetry(records[-1])
+    finally:
+        ring.close()
+
+
+class ArmPipeline:
+    """Runs the control loop in its own process, isolated from UI and recording"""
+
+    def __init__(
+        self,
+        config: dict = None,
+        cpu: Optional[int] = None,
+        priority: Optional[int] = None,
+        dashboard: bool = False,
+        record_path: Optional[str] = None,
+    ):
+        self.config = config
+        self.cpu = cpu if cpu is not None else PIPELINE_CONFIG['cpu_affinity']
+        self.priority = priority if priority is not None else PIPELINE_CONFIG['realtime_priority']
+        self.dashboard = dashboard
+        self.record_path = record_path
+        self.events = get_event_log()
+
+        self._ctx = multiprocessing.get_context('spawn')
+        self._stop_event = self._ctx.Event()
+        self._rings: List[SharedRing] = []
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+
+    def _new_ring(self) -> SharedRing:
+        ring = SharedRing(capacity=PIPELINE_CONFIG['telemetry_capacity'])
+        self._rings.append(ring)
+        return ring
+
+    def start(self):
+        """Spawn the control process and any requested consumer processes"""
+        # One ring per consumer keeps every ring single-producer/single-consumer
+        if self.record_path:
+            ring = self._new_ring()
+            self._processes.append(self._ctx.Process(
+                target=recorder_process_main,
+                args=(ring.handle(), self._stop_event, self.record_path, PIPELINE_CONFIG['consumer_poll_interval']),
+                name="gpm-recorder",
+            ))
+
+        if self.dashboard:
+            ring = self._new_ring()
+            self._processes.append(self._ctx.Process(
+                target=dashboard_process_main,
+                args=(
+                    ring.handle(),
+                    self._stop_event,
+                    PIPELINE_CONFIG['dashboard_host'],
+                    PIPELINE_CONFIG['dashboard_port'],
+                    PIPELINE_CONFIG['consumer_poll_interval'],
+                ),
+                name="gpm-dashboard",
+            ))
+
+        control = self._ctx.Process(
+            target=control_process_main,
+            args=([ring.handle() for ring in self._rings], self._stop_event, self.config, self.cpu, self.priority),
+            name="gpm-control",
+        )
+        self._processes.insert(0, control)
+
+        for process in self._processes:
+            process.start()
+            self.events.info("pipeline", "Started %s (pid %d)", process.name, process.pid)
+
+    def wait(self) -> int:
+        """
+        Block until the control process exits or Ctrl+C is pressed
+
+        Returns:
+            Exit code of the control process
+        """
+        control = self._processes[0]
+        try:
+            control.join()
+        except KeyboardInterrupt:
+            self.events.info("pipeline", "Shutdown signal received...")
+        finally:
+            self.stop()
+        return control.exitcode
+
+    def stop(self, timeout: float = 5.0):
+        """Signal every process to stop, then release the shared rings"""
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                self.events.warning("pipeline", "%s did not exit, terminating", process.name)
+                process.terminate()
+                process.join()
+            if process.exitcode:
+                self.events.warning("pipeline", "%s exited with code %d", process.name, process.exitcode)
+        for ring in self._rings:
+            ring.close()
+        self._rings.clear()
+        self._processes.clear()
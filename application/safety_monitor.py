@@ -11,6 +11,7 @@ class SafetyMonitor:
     def __init__(self, hardware: HardwareInterface):
         self.hardware = hardware
         self.violations = []
+        self.last_status = None
        
     def check_constraints(self, desired_command: dict = None) -> bool:
         """
@@ -24,6 +25,7 @@ class SafetyMonitor:
         """
         try:
             bms_status = self.hardware.bms.get_status()
+            self.last_status = bms_status
         except Exception as e:
             self.violations = [f"BMS read error: {e}"]
             return False
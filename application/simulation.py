@@ -0,0 +1,598 @@
+"""Simulated hardware backend with physics models for load and soak testing
+
+Drop-in replacements for the gpm Maestro, Emg, Fsr, Bms and StateCell
+classes, all driven by one seeded SimulatedHardware world. Physics is
+integrated lazily up to the clock's current time, so with a SimClock the
+control stack runs as fast as the CPU allows while staying deterministic.
+"""
+from collections import deque
+from dataclasses import dataclass, fields, replace
+from typing import List, Optional, Tuple
+import math
+import time
+
+import numpy as np
+
+from application.state_machine import ArmState, STATE_CODES, StateTransition
+
+
+NUM_CHANNELS = 6
+
+# Same targets as Maestro::move_to_grip in src/hardware/maestro.rs; keep in sync
+GRIP_TARGETS = {
+    'rest': ((0, 1500), (1, 1500), (2, 1500)),
+    'pinch': ((0, 2000), (1, 1800), (2, 1500)),
+    'power': ((0, 2200), (1, 2200), (2, 2200)),
+    'open': ((0, 1000), (1, 1000), (2, 1000)),
+}
+
+# User intent driving the EMG model
+INTENT_REST = 0
+INTENT_OPEN = 1
+INTENT_CLOSE = 2
+
+
+class SimClock:
+    """Virtual clock whose sleep() advances time instantly"""
+
+    def __init__(self, start: float = 0.0, epoch: float = 1_700_000_000.0):
+        self.now = start
+        self.epoch = epoch
+        self._alarms: List[Tuple[float, callable]] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.epoch + self.now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.now += seconds
+        if self._alarms and self._alarms[0][0] <= self.now:
+            due = [alarm for alarm in self._alarms if alarm[0] <= self.now]
+            self._alarms = [alarm for alarm in self._alarms if alarm[0] > self.now]
+            for _, callback in due:
+                callback()
+
+    def call_at(self, when: float, callback):
+        """Run callback the first time sleep() reaches `when`"""
+        self._alarms.append((when, callback))
+        self._alarms.sort(key=lambda alarm: alarm[0])
+
+
+@dataclass
+class SimParams:
+    """Physical model parameters"""
+    # EMG front end (enveloped sensor output, 10-bit ADC counts)
+    emg_sample_rate: float = 1000.0
+    emg_baseline: float = 350.0
+    emg_activation_gain: float = 300.0
+    emg_crosstalk: float = 0.15
+    emg_noise: float = 15.0
+    emg_activation_noise: float = 0.1  # Noise grows with activation
+    emg_hum_amplitude: float = 20.0
+    mains_frequency: float = 60.0
+    emg_time_constant: float = 0.05  # Muscle activation rise/fall (s)
+
+    # User behaviour
+    mean_rest_time: float = 2.0
+    mean_gesture_time: float = 1.5
+    object_probability: float = 0.7  # Chance a close grabs an object
+
+    # Servos (PWM in microseconds)
+    servo_latency: float = 0.005  # Serial + controller latency (s)
+    servo_slew_rate: float = 2000.0  # us/s
+    servo_max_pwm: float = 2200.0
+    contact_pwm: float = 1800.0  # Position where fingers meet an object
+    servo_move_current: float = 0.8  # A per moving servo
+    servo_stall_current: float = 0.4  # A per servo at full grip force
+
+    # FSR (reading drops as force rises)
+    fsr_rest_value: float = 1000.0
+    fsr_force_gain: float = 700.0
+    fsr_noise: float = 5.0
+
+    # Battery (3S pack)
+    battery_capacity_ah: float = 2.2
+    internal_resistance: float = 0.05  # Ohm
+    idle_current: float = 0.3  # A
+    regulator_loss: float = 0.5  # W per A drawn
+    thermal_resistance: float = 8.0  # C/W
+    thermal_time_constant: float = 300.0  # s
+    ambient_temperature: float = 25.0
+
+    physics_step: float = 0.005  # s
+
+    @classmethod
+    def from_overrides(cls, overrides: dict) -> "SimParams":
+        """Defaults with the named fields replaced, e.g. from hardware.sim config"""
+        names = {field.name for field in fields(cls)}
+        unknown = sorted(set(overrides) - names)
+        if unknown:
+            raise ValueError(f"Unknown simulation parameters: {', '.join(unknown)}")
+        return replace(cls(), **{name: float(value) for name, value in overrides.items()})
+
+
+@dataclass
+class SimBmsStatus:
+    """Mirror of gpm.BmsStatus"""
+    voltage: float
+    current: float
+    temperature: float
+    is_healthy: bool
+    charge_percentage: float
+
+
+@dataclass
+class SimFsrReading:
+    """Mirror of gpm.FsrReading"""
+    fsr_id: int
+    channel: int
+    value: int
+    pressure_detected: bool
+
+
+class SimStateCell:
+    """Mirror of gpm.StateCell using the Python transition tables"""
+
+    def __init__(self):
+        self.state = STATE_CODES[ArmState.INITIALIZING]
+        self.trips = 0
+        self.reason: Optional[str] = None
+
+    def get(self) -> int:
+        return self.state
+
+    def compare_transition(self, from_state: int, to_state: int) -> bool:
+        if self.state != from_state or not StateTransition.is_valid_code(from_state, to_state):
+            return False
+        self.state = to_state
+        return True
+
+    def transition(self, to_state: int) -> Optional[int]:
+        previous = self.state
+        return previous if self.compare_transition(previous, to_state) else None
+
+    def trip(self, reason: str = "Safety trip") -> bool:
+        if self.transition(STATE_CODES[ArmState.ERROR]) is None:
+            return False
+        self.reason = reason
+        self.trips += 1
+        return True
+
+    def trip_reason(self) -> Optional[str]:
+        return self.reason
+
+    def trip_count(self) -> int:
+        return self.trips
+
+    @staticmethod
+    def is_valid(from_state: int, to_state: int) -> bool:
+        return StateTransition.is_valid_code(from_state, to_state)
+
+
+class SimulatedHardware:
+    """Seeded physics world shared by the simulated devices"""
+
+    FAULTS = ('servo_bus', 'bms_unhealthy', 'overheat')
+
+    def __init__(self, seed: int = 0, clock=None, params: Optional[SimParams] = None):
+        self.clock = clock or time
+        self.params = params or SimParams()
+        self.faults: set[str] = set()
+
+        intent_seed, emg_seed, fsr_seed = np.random.SeedSequence(seed).spawn(3)
+        self._intent_rng = np.random.default_rng(intent_seed)
+        self.emg_rng = np.random.default_rng(emg_seed)
+        self.fsr_rng = np.random.default_rng(fsr_seed)
+
+        self._t = self.clock.monotonic()
+
+        # Intent schedule: parallel lists of segment start, intent, effort, object present
+        self._seg_start: List[float] = [self._t - 1.0]
+        self._seg_intent: List[int] = [INTENT_REST]
+        self._seg_effort: List[float] = [0.0]
+        self._seg_object: List[bool] = [False]
+        self._seg_index = 0
+
+        # Servo state
+        self.position = [1500.0] * NUM_CHANNELS
+        self.target = [1500.0] * NUM_CHANNELS
+        self.force = [0.0] * NUM_CHANNELS
+        self.commands: deque = deque()  # (apply_time, ticket, targets)
+        self.submitted_ticket = 0
+        self.completed_ticket = 0
+        self.failures: deque = deque(maxlen=64)  # (ticket, error), like the native queue
+
+        # Battery state
+        self.soc = 1.0
+        self.current = self.params.idle_current
+        self.temperature = self.params.ambient_temperature
+
+        self.interlock = SimStateCell()
+        self.maestro = SimMaestro(self)
+        self.emg = SimEmg(self)
+        self.fsr = SimFsr(self)
+        self.bms = SimBms(self)
+
+    def inject_fault(self, kind: str, active: bool = True):
+        """
+        Enable or clear a fault
+
+        Args:
+            kind: 'servo_bus' (writes fail), 'bms_unhealthy' or 'overheat'
+            active: False clears the fault
+        """
+        if kind not in self.FAULTS:
+            raise ValueError(f"Unknown fault: {kind}")
+        if active:
+            self.faults.add(kind)
+        else:
+            self.faults.discard(kind)
+
+    # ------------------------------------------------------------------
+    # Intent schedule
+    # ------------------------------------------------------------------
+
+    def _extend_schedule(self, until: float):
+        """Generate user intent segments covering up to `until`"""
+        p = self.params
+        rng = self._intent_rng
+        while self._seg_start[-1] <= until:
+            # Users alternate between resting and a single gesture
+            if self._seg_intent[-1] == INTENT_REST:
+                duration = rng.exponential(p.mean_rest_time)
+                intent = INTENT_OPEN if rng.random() < 0.5 else INTENT_CLOSE
+            else:
+                duration = rng.exponential(p.mean_gesture_time)
+                intent = INTENT_REST
+            effort = rng.uniform(0.7, 1.3) if intent != INTENT_REST else 0.0
+            if intent == INTENT_CLOSE:
+                holding = bool(rng.random() < p.object_probability)
+            elif intent == INTENT_OPEN:
+                holding = False
+            else:
+                holding = self._seg_object[-1]
+
+            self._seg_start.append(self._seg_start[-1] + max(duration, 0.2))
+            self._seg_intent.append(intent)
+            self._seg_effort.append(effort)
+            self._seg_object.append(holding)
+
+    def _prune_schedule(self, keep_after: float):
+        """Drop segments that ended before `keep_after`"""
+        drop = 0
+        while drop + 1 < len(self._seg_start) and self._seg_start[drop + 1] < keep_after:
+            drop += 1
+        if drop:
+            del self._seg_start[:drop], self._seg_intent[:drop], self._seg_effort[:drop], self._seg_object[:drop]
+            self._seg_index = max(0, self._seg_index - drop)
+
+    def schedule_arrays(self, until: float):
+        """Intent schedule as arrays, extended to cover `until`"""
+        self._extend_schedule(until)
+        return (
+            np.asarray(self._seg_start),
+            np.asarray(self._seg_intent),
+            np.asarray(self._seg_effort),
+        )
+
+    # ------------------------------------------------------------------
+    # Physics
+    # ------------------------------------------------------------------
+
+    def sync(self):
+        """Integrate the world up to the clock's current time"""
+        now = self.clock.monotonic()
+        if now <= self._t:
+            return
+        self._extend_schedule(now)
+        step = self.params.physics_step
+        while self._t < now:
+            dt = min(step, now - self._t)
+            self._step(self._t + dt, dt)
+        self._prune_schedule(now - 2.0)
+
+    def _step(self, t: float, dt: float):
+        p = self.params
+
+        while self.commands and self.commands[0][0] <= t:
+            _, ticket, targets = self.commands.popleft()
+            if 'servo_bus' in self.faults:
+                error = "Simulated servo bus failure"
+                self.failures.append((ticket, error))
+                self.interlock.trip(f"Servo write failed: {error}")
+            else:
+                for channel, pwm_value in targets:
+                    self.target[channel] = float(pwm_value)
+            self.completed_ticket = ticket
+
+        while self._seg_index + 1 < len(self._seg_start) and self._seg_start[self._seg_index + 1] <= t:
+            self._seg_index += 1
+        holding = self._seg_object[self._seg_index]
+
+        current = p.idle_current
+        max_move = p.servo_slew_rate * dt
+        for ch in range(NUM_CHANNELS):
+            target = self.target[ch]
+            blocked = holding and target > p.contact_pwm
+            limit = p.contact_pwm if blocked and self.position[ch] <= p.contact_pwm else target
+            move = max(-max_move, min(max_move, limit - self.position[ch]))
+            self.position[ch] += move
+            if move:
+                current += p.servo_move_current * abs(move) / max_move
+
+            if blocked and self.position[ch] >= p.contact_pwm - 1.0:
+                self.force[ch] = min(1.0, (target - p.contact_pwm) / (p.servo_max_pwm - p.contact_pwm))
+                current += p.servo_stall_current * self.force[ch]
+            else:
+                self.force[ch] = 0.0
+
+        self.current = current
+        self.soc = max(0.0, self.soc - current * dt / (p.battery_capacity_ah * 3600.0))
+
+        ambient = p.ambient_temperature + (50.0 if 'overheat' in self.faults else 0.0)
+        heat = current * current * p.internal_resistance + current * p.regulator_loss
+        steady = ambient + heat * p.thermal_resistance
+        self.temperature += (steady - self.temperature) * (dt / p.thermal_time_constant)
+
+        self._t = t
+
+    def open_circuit_voltage(self) -> float:
+        """3S pack voltage at rest for the current state of charge"""
+        soc = self.soc
+        return 10.5 + 1.6 * soc + 0.5 * soc ** 4 - 0.8 * (1.0 - soc) ** 8
+
+
+class SimMaestro:
+    """Simulated Maestro: targets apply after a latency and servos slew"""
+
+    def __init__(self, world: SimulatedHardware):
+        self.world = world
+
+    def set_target(self, channel: int, pwm_value: int) -> int:
+        return self.set_targets([(channel, pwm_value)])
+
+    def set_targets(self, targets: List[Tuple[int, int]]) -> int:
+        for channel, _ in targets:
+            if not 0 <= channel < NUM_CHANNELS:
+                raise RuntimeError(f"Maestro error: Invalid channel: {channel}")
+        world = self.world
+        world.sync()
+        world.submitted_ticket += 1
+        apply_time = world.clock.monotonic() + world.params.servo_latency
+        world.commands.append((apply_time, world.submitted_ticket, list(targets)))
+        return world.submitted_ticket
+
+    def move_to_grip(self, grip_type: str) -> int:
+        if grip_type not in GRIP_TARGETS:
+            raise RuntimeError(f"Move failed: Unknown grip type: {grip_type}")
+        return self.set_targets(list(GRIP_TARGETS[grip_type]))
+
+    def attach_interlock(self, cell):
+        """Servo bus faults always trip the world's interlock"""
+
+    def _status(self, ticket: int) -> bool:
+        world = self.world
+        if world.completed_ticket < ticket:
+            return False
+        for failed, error in world.failures:
+            if failed == ticket:
+                raise RuntimeError(f"Maestro error: {error}")
+        return True
+
+    def is_done(self, ticket: int) -> bool:
+        self.world.sync()
+        return self._status(ticket)
+
+    def wait(self, ticket: int, timeout: float = 1.0) -> bool:
+        if not math.isfinite(timeout):
+            raise ValueError(f"Invalid timeout {timeout}")
+        world = self.world
+        timeout = max(timeout, 0.0)
+        deadline = world.clock.monotonic() + timeout
+        for apply_time, pending, _ in world.commands:
+            if pending >= ticket:
+                if apply_time > deadline:
+                    world.clock.sleep(timeout)
+                    return False
+                world.clock.sleep(apply_time - world.clock.monotonic())
+                break
+        world.sync()
+        return self._status(ticket)
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        return self.wait(self.world.submitted_ticket, timeout)
+
+    def current_pwm(self, channel: int) -> int:
+        if not 0 <= channel < NUM_CHANNELS:
+            raise RuntimeError(f"Read failed: Invalid channel: {channel}")
+        self.world.sync()
+        return int(round(self.world.position[channel]))
+
+    def positions(self) -> List[int]:
+        self.world.sync()
+        return [int(round(position)) for position in self.world.position]
+
+
+class SimEmg:
+    """Simulated two-channel EMG envelope sensor with noise and mains hum"""
+
+    def __init__(self, world: SimulatedHardware):
+        self.world = world
+        self.buffer_size = 256
+        self.buffer: List[int] = []
+        self.inner_threshold = 450.0
+        self.outer_threshold = 450.0
+        self._hum_phase = world.emg_rng.uniform(0.0, 2.0 * math.pi, size=2)
+
+    def configure(self, buffer_size: int):
+        self.buffer_size = buffer_size
+
+    def read_buffer(self) -> List[int]:
+        """Return the most recent buffer_size interleaved samples ending now"""
+        world = self.world
+        p = world.params
+        world.sync()
+
+        n = self.buffer_size // 2
+        now = world.clock.monotonic()
+        t = now - np.arange(n - 1, -1, -1) / p.emg_sample_rate
+
+        starts, intents, efforts = world.schedule_arrays(now)
+        idx = np.clip(np.searchsorted(starts, t, side='right') - 1, 0, None)
+
+        samples = np.empty(2 * n, dtype=np.int64)
+        rng = world.emg_rng
+        for ch, active_intent in ((0, INTENT_OPEN), (1, INTENT_CLOSE)):
+            level = np.where(intents == active_intent, efforts, efforts * p.emg_crosstalk)
+            previous = np.concatenate(([0.0], level[:-1]))
+            decay = np.exp(-(t - starts[idx]) / p.emg_time_constant)
+            activation = level[idx] + (previous[idx] - level[idx]) * decay
+
+            signal = (
+                p.emg_baseline
+                + p.emg_activation_gain * activation
+                + rng.standard_normal(n) * (p.emg_noise + p.emg_activation_noise * p.emg_activation_gain * activation)
+                + p.emg_hum_amplitude * np.sin(2.0 * math.pi * p.mains_frequency * t + self._hum_phase[ch])
+            )
+            samples[ch::2] = np.clip(np.rint(signal), 0, 1023)
+
+        self.buffer = samples.tolist()
+        return self.buffer
+
+    def is_ready(self) -> bool:
+        return True
+
+    def get_latest_samples(self) -> List[int]:
+        return list(self.buffer)
+
+    def calibrate(self, inner_threshold: float, outer_threshold: float):
+        self.inner_threshold = inner_threshold
+        self.outer_threshold = outer_threshold
+
+    def process_data(self, values: List[float]) -> int:
+        """Same threshold classifier as the native Emg"""
+        if len(values) != 2:
+            raise RuntimeError("Process error: Expected 2 EMG values")
+        if values[0] >= self.inner_threshold and values[1] <= self.outer_threshold:
+            return 1
+        if values[0] <= self.inner_threshold and values[1] >= self.outer_threshold:
+            return 0
+        return -1
+
+
+class SimFsr:
+    """Simulated FSRs on the fingertips: readings fall as grip force rises"""
+
+    def __init__(self, world: SimulatedHardware):
+        self.world = world
+        self.cs_pins = [7]
+        self.at_rest_threshold = 900
+        self.pressure_threshold = 500
+        self.num_channels = 8
+
+    def configure(self, cs_pins: List[int], at_rest_threshold: int, pressure_threshold: int):
+        self.cs_pins = list(cs_pins)
+        self.at_rest_threshold = at_rest_threshold
+        self.pressure_threshold = pressure_threshold
+
+    def read_all(self) -> List[SimFsrReading]:
+        world = self.world
+        p = world.params
+        world.sync()
+
+        readings = []
+        for fsr_id in range(len(self.cs_pins)):
+            noise = world.fsr_rng.standard_normal(self.num_channels) * p.fsr_noise
+            for channel in range(self.num_channels):
+                force = world.force[channel] if channel < NUM_CHANNELS else 0.0
+                value = int(min(1023, max(0, round(p.fsr_rest_value - p.fsr_force_gain * force + noise[channel]))))
+                readings.append(SimFsrReading(fsr_id, channel, value, value < self.at_rest_threshold))
+        return readings
+
+    def process_data(self) -> bool:
+        return any(reading.pressure_detected for reading in self.read_all())
+
+
+class SimBms:
+    """Simulated battery: discharges and heats under servo current"""
+
+    def __init__(self, world: SimulatedHardware):
+        self.world = world
+
+    def get_status(self) -> SimBmsStatus:
+        world = self.world
+        world.sync()
+
+        voltage = world.open_circuit_voltage() - world.current * world.params.internal_resistance
+        is_healthy = voltage > 10.0 and world.temperature < 50.0 and 'bms_unhealthy' not in world.faults
+        # Same linear approximation as the native Bms: 10V = 0%, 12.6V = 100%
+        charge = min(100.0, max(0.0, (voltage - 10.0) / 2.6 * 100.0))
+        return SimBmsStatus(voltage, world.current, world.temperature, is_healthy, charge)
+
+    def update(self):
+        self.world.sync()
+
+
+def run_soak(hours: float, seed: int = 0, config: Optional[dict] = None, params: Optional[dict] = None) -> dict:
+    """
+    Run the full control stack on simulated hardware for `hours` of simulated time
+
+    The run ends early at the first ERROR (e.g. the battery going unhealthy),
+    since the control loop latches it; `completed` and `trip_reason` in the
+    summary report whether and why that happened.
+
+    Args:
+        hours: Simulated duration
+        seed: Seed for the simulated world
+        config: Hardware config overrides (backend is forced to 'sim')
+        params: SimParams overrides on top of the config's sim_params,
+            e.g. {'battery_capacity_ah': 10.0}
+
+    Returns:
+        Summary of the run
+    """
+    from main import ArmController
+    from config.constants import HARDWARE_CONFIG
+
+    clock = SimClock()
+    hardware_config = dict(config or HARDWARE_CONFIG, backend='sim', sim_seed=seed)
+    hardware_config['sim_params'] = {**hardware_config.get('sim_params', {}), **(params or {})}
+    controller = ArmController(hardware_config, clock=clock)
+    world = controller.hardware.sim
+
+    trips: List[Tuple[float, Optional[str]]] = []
+
+    def record_trip(previous, new_state, error_message):
+        if new_state is ArmState.ERROR:
+            trips.append((clock.monotonic(), error_message))
+
+    controller.state_machine.add_listener(record_trip)
+
+    duration = hours * 3600.0
+    clock.call_at(duration, lambda: setattr(controller, 'running', False))
+
+    wall_start = time.perf_counter()
+    if controller.initialize():
+        controller.process_emg_stream()
+    wall_time = time.perf_counter() - wall_start
+
+    simulated = clock.monotonic()
+    status = controller.hardware.bms.get_status()
+    return {
+        'simulated_seconds': simulated,
+        'completed': simulated >= duration and not trips,
+        'wall_seconds': wall_time,
+        'speedup': simulated / wall_time if wall_time > 0 else float('inf'),
+        'final_state': controller.state_machine.get_state().value,
+        'trip_time': trips[0][0] if trips else None,
+        'trip_reason': trips[0][1] if trips else None,
+        'servo_commands': world.submitted_ticket,
+        'transitions': len(controller.state_machine.get_history()),
+        'interlock_trips': world.interlock.trip_count(),
+        'state_of_charge': world.soc,
+        'voltage': status.voltage,
+        'temperature': status.temperature,
+    }
@@ -1,6 +1,10 @@
 """State machine for arm state management"""
+from collections import deque
 from enum import Enum
-from typing import Optional
+from typing import Callable, Deque, List, Optional, Tuple
+import time
+
+from application.event_log import get_event_log
 
 
 class ArmState(Enum):
@@ -13,66 +17,184 @@ class ArmState(Enum):
     SHUTDOWN = "shutdown"
 
 
+# Integer codes follow declaration order and must match src/state.rs
+STATES: Tuple[ArmState, ...] = tuple(ArmState)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+
+def _state_mask(states) -> int:
+    """Pack a collection of states into a bitmask indexed by state code"""
+    mask = 0
+    for state in states:
+        mask |= 1 << STATE_CODES[state]
+    return mask
+
+
 class StateTransition:
     """Represents a state transition with validation"""
-    
+
     VALID_TRANSITIONS = {
-        ArmState.INITIALIZING: [ArmState.IDLE, ArmState.ERROR],
-        ArmState.IDLE: [ArmState.ACTIVE, ArmState.CALIBRATING, ArmState.SHUTDOWN, ArmState.ERROR],
-        ArmState.ACTIVE: [ArmState.IDLE, ArmState.ERROR, ArmState.SHUTDOWN],
-        ArmState.CALIBRATING: [ArmState.IDLE, ArmState.ERROR],
-        ArmState.ERROR: [ArmState.IDLE, ArmState.SHUTDOWN],
-        ArmState.SHUTDOWN: [],
+        ArmState.INITIALIZING: (ArmState.IDLE, ArmState.ERROR),
+        ArmState.IDLE: (ArmState.ACTIVE, ArmState.CALIBRATING, ArmState.SHUTDOWN, ArmState.ERROR),
+        ArmState.ACTIVE: (ArmState.IDLE, ArmState.ERROR, ArmState.SHUTDOWN),
+        ArmState.CALIBRATING: (ArmState.IDLE, ArmState.ERROR),
+        ArmState.ERROR: (ArmState.IDLE, ArmState.SHUTDOWN),
+        ArmState.SHUTDOWN: (),
     }
-    
+
+    # TRANSITION_MASKS[from_code] has bit to_code set if the transition is allowed
+    TRANSITION_MASKS: Tuple[int, ...] = tuple(map(_state_mask, map(VALID_TRANSITIONS.__getitem__, STATES)))
+
+    OPERATIONAL_MASK = _state_mask((ArmState.IDLE, ArmState.ACTIVE))
+
     @staticmethod
     def is_valid(from_state: ArmState, to_state: ArmState) -> bool:
         """Check if transition is valid"""
-        return to_state in StateTransition.VALID_TRANSITIONS.get(from_state, [])
+        return StateTransition.is_valid_code(STATE_CODES[from_state], STATE_CODES[to_state])
+
+    @staticmethod
+    def is_valid_code(from_code: int, to_code: int) -> bool:
+        """Check if transition is valid, by state code"""
+        return (StateTransition.TRANSITION_MASKS[from_code] >> to_code) & 1 == 1
+
+
+# (previous_state, new_state) -> True to allow the transition
+TransitionHook = Callable[[ArmState, ArmState], bool]
+# (previous_state, new_state, error_message)
+TransitionListener = Callable[[ArmState, ArmState, Optional[str]], None]
 
 
 class StateMachine:
-    """Manages state transitions for the prosthetic arm"""
-    
-    def __init__(self):
+    """Manages state transitions for the prosthetic arm
+
+    Transitions are validated against precomputed bitmask tables. Hooks
+    registered for a target state run before entering it and can veto the
+    transition; listeners run after every transition. The last
+    ``history_size`` transitions are kept as (timestamp, from, to).
+
+    When a native ``gpm.StateCell`` is attached, it holds the authoritative
+    state so native components (e.g. the Maestro flush thread) can trip the
+    arm into ERROR directly. Such changes are picked up by ``sync()``.
+    """
+
+    def __init__(self, cell=None, history_size: int = 64, clock=None):
         self.current_state = ArmState.INITIALIZING
         self.previous_state: Optional[ArmState] = None
         self.error_message: Optional[str] = None
-    
+        self.events = get_event_log()
+        self.clock = clock or time
+
+        self._code = STATE_CODES[self.current_state]
+        self._cell = cell
+        self._hooks: Tuple[List[TransitionHook], ...] = tuple([] for _ in STATES)
+        self._listeners: List[TransitionListener] = []
+        self.history: Deque[Tuple[float, ArmState, ArmState]] = deque(maxlen=history_size)
+
+        if cell is not None:
+            self.sync()
+
+    def add_hook(self, state: ArmState, hook: TransitionHook):
+        """Register a guard that runs before entering `state` and may veto it"""
+        self._hooks[STATE_CODES[state]].append(hook)
+
+    def add_listener(self, listener: TransitionListener):
+        """Register a callback invoked after every transition"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: TransitionListener):
+        """Unregister a transition callback"""
+        self._listeners.remove(listener)
+
     def transition_to(self, new_state: ArmState, error_message: Optional[str] = None) -> bool:
         """
         Attempt to transition to a new state
-        
+
         Args:
             new_state: Target state
             error_message: Optional error message if transitioning to ERROR state
-            
+
         Returns:
             True if transition succeeded
         """
-        if not StateTransition.is_valid(self.current_state, new_state):
-            print(f"Invalid transition: {self.current_state} -> {new_state}")
+        if self._cell is not None:
+            self.sync()
+
+        new_code = STATE_CODES[new_state]
+        if not StateTransition.is_valid_code(self._code, new_code):
+            self.events.warning("state", "Invalid transition: %s -> %s", self.current_state, new_state)
             return False
-        
-        self.previous_state = self.current_state
+
+        for hook in self._hooks[new_code]:
+            if not hook(self.current_state, new_state):
+                self.events.warning("state", "Transition vetoed: %s -> %s", self.current_state, new_state)
+                return False
+
+        if self._cell is not None and not self._cell.compare_transition(self._code, new_code):
+            # Native layer changed state underneath us
+            self.sync()
+            self.events.warning("state", "Transition lost race with native layer: -> %s", new_state)
+            return False
+
+        self._apply(new_code, error_message)
+        return True
+
+    def sync(self) -> bool:
+        """
+        Pick up a state change made by the native layer
+
+        Returns:
+            True if the state changed
+        """
+        if self._cell is None:
+            return False
+        code = self._cell.get()
+        if code == self._code:
+            return False
+        if STATES[code] is ArmState.ERROR:
+            self._apply(code, self._cell.trip_reason() or "Native safety trip")
+        else:
+            self._apply(code, None)
+        return True
+
+    def _apply(self, new_code: int, error_message: Optional[str]):
+        """Commit a transition and notify listeners"""
+        previous = self.current_state
+        new_state = STATES[new_code]
+
+        self.previous_state = previous
         self.current_state = new_state
-        
-        if new_state == ArmState.ERROR:
+        self._code = new_code
+
+        if new_state is ArmState.ERROR:
             self.error_message = error_message or "Unknown error"
         else:
             self.error_message = None
-        
-        print(f"State transition: {self.previous_state} -> {self.current_state}")
-        return True
-    
+
+        self.history.append((self.clock.monotonic(), previous, new_state))
+        self.events.info("state", "State transition: %s -> %s", previous, new_state)
+
+        for listener in self._listeners:
+            try:
+                listener(previous, new_state, self.error_message)
+            except Exception as e:
+                self.events.error("state", "Transition listener failed: %s", e)
+
     def get_state(self) -> ArmState:
         """Get current state"""
+        if self._cell is not None:
+            self.sync()
         return self.current_state
-    
+
     def is_operational(self) -> bool:
         """Check if arm is operational"""
-        return self.current_state in [ArmState.IDLE, ArmState.ACTIVE]
-    
+        if self._cell is not None:
+            self.sync()
+        return (StateTransition.OPERATIONAL_MASK >> self._code) & 1 == 1
+
     def get_error_message(self) -> Optional[str]:
         """Get current error message if in ERROR state"""
         return self.error_message
+
+    def get_history(self) -> List[Tuple[float, ArmState, ArmState]]:
+        """Get recent transitions as (monotonic timestamp, from, to), oldest first"""
+        return list(self.history)
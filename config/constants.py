@@ -21,6 +21,15 @@ CONFIG = load_config()
 
 # Hardware Configuration
 HARDWARE_CONFIG = {
+    'backend': CONFIG.get('hardware', {}).get('backend', 'native'),
+    'sim_seed': CONFIG.get('hardware', {}).get('sim', {}).get('seed', 0),
+    # Every other hardware.sim key overrides the SimParams field of that name
+    'sim_params': {
+        key: value
+        for key, value in (CONFIG.get('hardware', {}).get('sim') or {}).items()
+        if key != 'seed'
+    },
+    
     'emg_buffer_size': CONFIG.get('hardware', {}).get('emg', {}).get('buffer_size', 256),
     'emg_cs_pin': CONFIG.get('hardware', {}).get('emg', {}).get('cs_pin', 8),
     'emg_clock_speed': CONFIG.get('hardware', {}).get('emg', {}).get('clock_speed', 1350000),
@@ -59,10 +68,22 @@ SAFETY_CONFIG = {
 APP_CONFIG = {
     'control_loop_rate': CONFIG.get('application', {}).get('control_loop_rate', 100),
     'gesture_hold_time': CONFIG.get('application', {}).get('gesture_hold_time', 5),
+    'gesture_vote_threshold': CONFIG.get('application', {}).get('gesture_vote_threshold', 0.6),
+    'gesture_min_dwell_time': CONFIG.get('application', {}).get('gesture_min_dwell_time', 0.3),
     'debug_mode': CONFIG.get('application', {}).get('debug_mode', False),
     'log_level': CONFIG.get('application', {}).get('log_level', 'INFO'),
 }
 
+# Multiprocess Pipeline
+PIPELINE_CONFIG = {
+    'cpu_affinity': CONFIG.get('pipeline', {}).get('cpu_affinity', None),
+    'realtime_priority': CONFIG.get('pipeline', {}).get('realtime_priority', None),
+    'telemetry_capacity': CONFIG.get('pipeline', {}).get('telemetry_capacity', 1024),
+    'consumer_poll_interval': CONFIG.get('pipeline', {}).get('consumer_poll_interval', 0.1),
+    'dashboard_host': CONFIG.get('pipeline', {}).get('dashboard_host', '0.0.0.0'),
+    'dashboard_port': CONFIG.get('pipeline', {}).get('dashboard_port', 5000),
+}
+
 # Derived constants
 CONTROL_LOOP_PERIOD = 1.0 / APP_CONFIG['control_loop_rate']  # seconds
 
@@ -3,6 +3,6 @@
 Python interface to hardware drivers (Rust extension module).
 """
 
-from gpm import Maestro, Emg, Fsr, Bms, BmsStatus, FsrReading
+from gpm import Maestro, Emg, Fsr, Bms, BmsStatus, FsrReading, StateCell
 
-__all__ = ["Maestro", "Emg", "Fsr", "Bms", "BmsStatus", "FsrReading"]
+__all__ = ["Maestro", "Emg", "Fsr", "Bms", "BmsStatus", "FsrReading", "StateCell"]
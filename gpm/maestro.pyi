@@ -1,26 +1,101 @@
 """Type stubs for Maestro servo controller"""
+from gpm.state import StateCell
 
 class Maestro:
-    """Maestro servo controller interface"""
+    """Maestro servo controller interface
+    
+    Targets are written by a background flush thread. Pending targets for
+    the same channel are coalesced, and each queueing call returns a ticket
+    that can be polled with is_done() or awaited with wait().
+    """
     
     def __init__(self) -> None:
         """Initialize the Maestro controller"""
         ...
     
-    def set_target(self, channel: int, pwm_value: int) -> None:
-        """Set target PWM for a servo channel
+    def set_target(self, channel: int, pwm_value: int) -> int:
+        """Queue target PWM for a servo channel
         
         Args:
             channel: Servo channel (0-5)
             pwm_value: PWM value (typically 1000-2000)
+            
+        Returns:
+            Completion ticket
+        """
+        ...
+    
+    def set_targets(self, targets: list[tuple[int, int]]) -> int:
+        """Queue targets for several channels as one batch
+        
+        Args:
+            targets: List of (channel, pwm_value) pairs
+            
+        Returns:
+            Completion ticket
         """
         ...
     
-    def move_to_grip(self, grip_type: str) -> None:
-        """Move to predefined grip type
+    def move_to_grip(self, grip_type: str) -> int:
+        """Queue a predefined grip type
         
         Args:
             grip_type: One of "rest", "pinch", "power", "open"
+            
+        Returns:
+            Completion ticket
+        """
+        ...
+    
+    def attach_interlock(self, cell: StateCell) -> None:
+        """Trip a state cell to ERROR whenever a servo write fails
+        
+        Args:
+            cell: StateCell shared with the application StateMachine
+        """
+        ...
+    
+    def is_done(self, ticket: int) -> bool:
+        """Check whether a queued command has been written
+        
+        Args:
+            ticket: Ticket returned by a queueing call
+            
+        Returns:
+            True once the command was sent
+            
+        Raises:
+            RuntimeError: If the write carrying this ticket failed
+        """
+        ...
+    
+    def wait(self, ticket: int, timeout: float = 1.0) -> bool:
+        """Wait for a queued command to be written
+        
+        Args:
+            ticket: Ticket returned by a queueing call
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if written, False on timeout
+            
+        Raises:
+            RuntimeError: If the write carrying this ticket failed
+            ValueError: If timeout is NaN or too large to represent
+        """
+        ...
+    
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait for every queued command to be written
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the queue drained, False on timeout
+            
+        Raises:
+            ValueError: If timeout is NaN or too large to represent
         """
         ...
     
@@ -33,4 +108,12 @@ class Maestro:
         Returns:
             Current PWM value
         """
-        ...
\ No newline at end of file
+        ...
+    
+    def positions(self) -> list[int]:
+        """Get current PWM values for all channels in one call
+        
+        Returns:
+            List of PWM values indexed by channel
+        """
+        ...
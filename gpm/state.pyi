@@ -0,0 +1,79 @@
+"""Type stubs for native arm state cell"""
+from typing import Optional
+
+class StateCell:
+    """Arm state shared between the Python StateMachine and native components
+    
+    State codes index application.state_machine.STATES.
+    """
+    
+    def __init__(self) -> None:
+        """Create a cell in the INITIALIZING state"""
+        ...
+    
+    def get(self) -> int:
+        """Get current state code
+        
+        Returns:
+            Index into application.state_machine.STATES
+        """
+        ...
+    
+    def compare_transition(self, from_state: int, to_state: int) -> bool:
+        """Transition from an expected state to a new one
+        
+        Args:
+            from_state: State code the caller believes is current
+            to_state: Target state code
+            
+        Returns:
+            True if the transition is valid and the state was still from_state
+        """
+        ...
+    
+    def transition(self, to_state: int) -> Optional[int]:
+        """Transition from the current state, if allowed
+        
+        Args:
+            to_state: Target state code
+            
+        Returns:
+            Previous state code, or None if the transition is invalid
+        """
+        ...
+    
+    def trip(self, reason: str = "Safety trip") -> bool:
+        """Force the ERROR state
+        
+        Args:
+            reason: Why the arm was tripped, reported by trip_reason()
+            
+        Returns:
+            True if the cell moved to ERROR
+        """
+        ...
+    
+    def trip_reason(self) -> Optional[str]:
+        """Reason given for the most recent successful trip
+        
+        Returns:
+            Reason string, or None if the cell was never tripped
+        """
+        ...
+    
+    def trip_count(self) -> int:
+        """Number of successful safety trips"""
+        ...
+    
+    @staticmethod
+    def is_valid(from_state: int, to_state: int) -> bool:
+        """Check a transition against the native table
+        
+        Args:
+            from_state: Source state code
+            to_state: Target state code
+            
+        Returns:
+            True if allowed
+        """
+        ...
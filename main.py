@@ -7,24 +7,40 @@ from typing import Optional
 from application.hardware import HardwareInterface
 from application.grip_controller import GripController, GripType
 from application.safety_monitor import SafetyMonitor
-from application.state_machine import StateMachine, ArmState
+from application.state_machine import StateMachine, ArmState, STATE_CODES
 from application.command_sequencer import CommandSequencer
+from application.gesture_filter import GestureFilter
+from application.event_log import get_event_log
 from config.constants import APP_CONFIG, CONTROL_LOOP_PERIOD
 
 
 class ArmController:
     """Main application orchestrator"""
    
-    def __init__(self, config: dict = None):
-        print("Initializing GPM...")
+    def __init__(self, config: dict = None, clock=None):
+        self.events = get_event_log()
+        self.events.info("main", "Initializing GPM...")
         
-        self.state_machine = StateMachine()
-        self.hardware = HardwareInterface(config)
+        # Anything with monotonic()/time()/sleep(); a SimClock runs faster than real time
+        self.clock = clock or time
+        
+        self.hardware = HardwareInterface(config, clock=clock)
+        self.state_machine = StateMachine(cell=self.hardware.interlock, clock=self.clock)
         self.grip_controller = GripController(self.hardware)
         self.safety_monitor = SafetyMonitor(self.hardware)
         self.command_sequencer = CommandSequencer()
+        self.gesture_filter = GestureFilter(
+            window_size=APP_CONFIG['gesture_hold_time'],
+            vote_threshold=APP_CONFIG['gesture_vote_threshold'],
+            min_dwell_time=APP_CONFIG['gesture_min_dwell_time'],
+        )
+        
+        # Shared-memory rings fed once per loop iteration (see application.pipeline)
+        self.telemetry: list = []
+        self._grip_codes = {grip: i for i, grip in enumerate(GripType)}
         
         self.running = False
+        self._closed = False
         self._setup_signal_handlers()
         
     def _setup_signal_handlers(self):
@@ -33,43 +49,49 @@ class ArmController:
         signal.signal(signal.SIGTERM, self._signal_handler)
     
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
-        print("\nShutdown signal received...")
-        self.shutdown()
+        """Ask the running loop to stop; its caller then calls shutdown()
+
+        Must not log or close anything: the interrupted main thread may be
+        holding the event log lock.
+        """
+        if not self.running:
+            # Nothing to wind down, behave like the default Ctrl+C handler
+            raise KeyboardInterrupt
+        self.running = False
     
     def initialize(self) -> bool:
         """Initialize hardware and transition to IDLE state"""
         try:
-            print("Initializing hardware...")
+            self.events.info("main", "Initializing hardware...")
             self.hardware.initialize()
             
             # Check initial status
             status = self.hardware.get_status()
-            print(f"BMS Status: {status['bms']}")
-            print(f"EMG Ready: {status['emg_ready']}")
+            self.events.info("main", "BMS Status: %s", status['bms'])
+            self.events.info("main", "EMG Ready: %s", status['emg_ready'])
             
             # Safety check
             if not self.safety_monitor.check_constraints():
-                print("Safety check failed:")
                 for violation in self.safety_monitor.get_violations():
-                    print(f"  - {violation}")
+                    self.events.error("safety", "Safety check failed: %s", violation)
                 self.state_machine.transition_to(ArmState.ERROR, "Initial safety check failed")
                 return False
             
             self.state_machine.transition_to(ArmState.IDLE)
-            print("Initialization complete")
+            self.events.info("main", "Initialization complete")
             return True
             
         except Exception as e:
-            print(f"Initialization failed: {e}")
+            self.events.error("main", "Initialization failed: %s", e)
             self.state_machine.transition_to(ArmState.ERROR, str(e))
             return False
     
     def process_emg_stream(self):
         """Main control loop: read sensors, classify gestures, execute commands"""
-        print("Starting EMG processing loop...")
+        self.events.info("control", "Starting EMG processing loop...")
         self.running = True
         self.state_machine.transition_to(ArmState.ACTIVE)
+        self.gesture_filter.reset(self.grip_controller.get_current_grip())
         
         gesture_map = {
             1: GripType.OPEN,
@@ -78,17 +100,19 @@ class ArmController:
         }
         
         loop_count = 0
+        next_tick = self.clock.monotonic()
         
         try:
             while self.running and self.state_machine.is_operational():
-                loop_start = time.time()
+                loop_start = self.clock.monotonic()
+                gesture = -1
+                emg_ready = self.hardware.emg.is_ready()
                 
                 # Periodic safety check
                 if loop_count % 100 == 0:
                     if not self.safety_monitor.check_constraints():
-                        print("Safety violation detected:")
                         for violation in self.safety_monitor.get_violations():
-                            print(f"  - {violation}")
+                            self.events.error("safety", "Safety violation detected: %s", violation)
                         self.state_machine.transition_to(
                             ArmState.ERROR,
                             "; ".join(self.safety_monitor.get_violations())
@@ -96,7 +120,7 @@ class ArmController:
                         break
                 
                 # Read EMG data
-                if self.hardware.emg.is_ready():
+                if emg_ready:
                     try:
                         samples = self.hardware.emg.read_buffer()
                         
@@ -107,37 +131,105 @@ class ArmController:
                             
                             gesture = self.hardware.emg.process_data([ch0_avg, ch1_avg])
                             
-                            if gesture in gesture_map and gesture_map[gesture] is not None:
-                                grip_type = gesture_map[gesture]
-                                
-                                if APP_CONFIG['debug_mode']:
-                                    print(f"Gesture detected: {gesture} -> {grip_type.value}")
-                                
+                            self.events.debug("control", "Gesture detected: %s -> %s", gesture, gesture_map.get(gesture))
+                            
+                            # Only actuate on a debounced change of grip
+                            grip_type = self.gesture_filter.update(gesture_map.get(gesture), now=self.clock.monotonic())
+                            
+                            if grip_type is not None:
                                 if self.grip_controller.execute_grip(grip_type):
-                                    print(f"Grip executed: {grip_type.value}")
+                                    self.events.debug("control", "Grip queued: %s", grip_type.value)
                                 else:
-                                    print(f"Grip execution failed: {grip_type.value}")
+                                    self.events.warning("control", "Grip execution failed: %s", grip_type.value)
+                                    self.gesture_filter.reset(self.grip_controller.get_current_grip())
                     
                     except Exception as e:
-                        print(f"EMG processing error: {e}")
+                        self.events.error("control", "EMG processing error: %s", e)
+                
+                self._check_grip_motion()
+                
+                if self.telemetry:
+                    self._publish_telemetry(gesture, emg_ready, self.clock.monotonic() - loop_start)
                 
-                # Maintain loop rate
+                # Maintain loop rate against absolute deadlines so jitter doesn't accumulate
                 loop_count += 1
-                elapsed = time.time() - loop_start
-                if elapsed < CONTROL_LOOP_PERIOD:
-                    time.sleep(CONTROL_LOOP_PERIOD - elapsed)
+                next_tick += CONTROL_LOOP_PERIOD
+                delay = next_tick - self.clock.monotonic()
+                if delay > 0:
+                    self.clock.sleep(delay)
+                else:
+                    next_tick = self.clock.monotonic()
         
         except Exception as e:
-            print(f"Control loop error: {e}")
+            self.events.error("control", "Control loop error: %s", e)
             self.state_machine.transition_to(ArmState.ERROR, str(e))
         
         finally:
-            self.state_machine.transition_to(ArmState.IDLE)
-            print("EMG processing loop stopped")
+            self.running = False
+            # A failed write trips ERROR and ends the loop before the next poll
+            self._check_grip_motion()
+            # ERROR latches until recover() is called explicitly
+            if self.state_machine.get_state() == ArmState.ACTIVE:
+                self.state_machine.transition_to(ArmState.IDLE)
+            self.events.info("control", "EMG processing loop stopped")
+    
+    def _check_grip_motion(self):
+        """Resolve the in-flight grip command and resync the filter if it failed"""
+        sent = self.grip_controller.poll_motion()
+        if sent is None:
+            return
+        current = self.grip_controller.get_current_grip()
+        if sent:
+            self.events.info("control", "Grip executed: %s", current.value)
+        else:
+            self.events.warning("control", "Grip write failed, holding %s", current.value)
+            self.gesture_filter.reset(current)
+    
+    def recover(self) -> bool:
+        """Clear a latched ERROR state once its cause has cleared
+
+        Safety constraints must pass and a write of the last confirmed grip
+        must reach the servos, since the trip may have come from the bus.
+        """
+        if self.state_machine.get_state() != ArmState.ERROR:
+            return False
+        
+        if not self.safety_monitor.check_constraints():
+            for violation in self.safety_monitor.get_violations():
+                self.events.error("safety", "Cannot recover: %s", violation)
+            return False
+        
+        if not self.grip_controller.restore_grip():
+            self.events.error("main", "Cannot recover: servo write still failing")
+            return False
+        
+        self.events.info("main", "Recovering from error: %s", self.state_machine.get_error_message())
+        return self.state_machine.transition_to(ArmState.IDLE)
+    
+    def _publish_telemetry(self, gesture: int, emg_ready: bool, loop_time: float):
+        """Push one telemetry record to every attached consumer ring"""
+        bms = self.safety_monitor.last_status
+        nan = float('nan')
+        record = (
+            self.clock.time(),
+            STATE_CODES[self.state_machine.current_state],
+            self._grip_codes[self.grip_controller.get_current_grip()],
+            gesture,
+            bms.voltage if bms else nan,
+            bms.current if bms else nan,
+            bms.temperature if bms else nan,
+            bms.charge_percentage if bms else nan,
+            1.0 if bms and bms.is_healthy else 0.0,
+            loop_time,
+            1.0 if emg_ready else 0.0,
+        )
+        for ring in self.telemetry:
+            ring.push(record)
     
     def run_demo(self):
         """Run a demo sequence of grips"""
-        print("\nRunning grip demo...")
+        self.events.info("demo", "Running grip demo...")
+        self.running = True
         self.state_machine.transition_to(ArmState.ACTIVE)
         
         demo_sequence = [
@@ -148,34 +240,47 @@ class ArmController:
         ]
         
         for grip_type, description in demo_sequence:
-            print(f"\n{description}...")
+            if not self.running:
+                break
+            self.events.info("demo", "%s...", description)
             
             if not self.safety_monitor.check_constraints():
-                print("Safety check failed, aborting demo")
+                self.events.error("demo", "Safety check failed, aborting demo")
                 break
             
-            if self.grip_controller.execute_grip(grip_type):
-                print(f"  ✓ {grip_type.value} executed")
+            if self.grip_controller.execute_grip(grip_type) and self.grip_controller.wait_for_motion():
+                self.events.info("demo", "✓ %s executed", grip_type.value)
             else:
-                print(f"  ✗ {grip_type.value} failed")
+                self.events.warning("demo", "✗ %s failed", grip_type.value)
             
-            time.sleep(2.0)
+            self.clock.sleep(2.0)
         
-        self.state_machine.transition_to(ArmState.IDLE)
-        print("\nDemo complete")
+        self.running = False
+        if self.state_machine.get_state() == ArmState.ACTIVE:
+            self.state_machine.transition_to(ArmState.IDLE)
+        self.events.info("demo", "Demo complete")
     
-    def shutdown(self):
-        """Graceful shutdown"""
-        print("Shutting down...")
+    def close(self):
+        """Stop the loop and release hardware without exiting the process"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        self.events.info("main", "Shutting down...")
         self.running = False
         self.state_machine.transition_to(ArmState.SHUTDOWN)
         
         try:
             self.hardware.shutdown()
         except Exception as e:
-            print(f"Error during shutdown: {e}")
+            self.events.error("main", "Error during shutdown: %s", e)
         
-        print("Shutdown complete")
+        self.events.info("main", "Shutdown complete")
+        self.events.close()
+    
+    def shutdown(self):
+        """Graceful shutdown"""
+        self.close()
         sys.exit(0)
 
 
@@ -1,22 +1,33 @@
 use anyhow::Result;
 use super::Resource;
+use crate::state::StateCell;
+
+use std::collections::VecDeque;
+use std::sync::{Arc, Condvar, Mutex};
+use std::thread::{self, JoinHandle};
+use std::time::{Duration, Instant};
 
 #[cfg(feature = "pi")]
 use raestro::maestro::{
     builder::Builder,
     constants::{Baudrate, Channel},
 };
-#[cfg(feature = "pi")]
-use std::time::Duration;
 
-pub struct Maestro {
+pub const NUM_CHANNELS: usize = 6;
+
+/// Failed ticket ranges remembered for is_done()/wait()
+const MAX_FAILURES: usize = 64;
+
+/// Serial-facing half of the Maestro, owned by the flush thread for writes
+/// and borrowed briefly for position reads.
+struct Driver {
     #[cfg(feature = "pi")]
-    pub controller: raestro::maestro::Maestro,
+    controller: raestro::maestro::Maestro,
     #[cfg(not(feature = "pi"))]
-    pwm_values: [u16; 6],
+    pwm_values: [u16; NUM_CHANNELS],
 }
 
-impl Resource for Maestro {
+impl Driver {
     #[cfg(feature = "pi")]
     fn init() -> Self {
         let controller: raestro::maestro::Maestro = Builder::default()
@@ -24,94 +35,299 @@ impl Resource for Maestro {
             .block_duration(Duration::from_millis(100))
             .try_into()
             .expect("Could not initialize Raestro");
-        Maestro { controller }
+        Driver { controller }
     }
 
     #[cfg(not(feature = "pi"))]
     fn init() -> Self {
-        Maestro {
-            pwm_values: [1500; 6],
+        Driver {
+            pwm_values: [1500; NUM_CHANNELS],
         }
     }
 
-    fn name() -> String {
-        "Maestro".to_string()
+    #[cfg(feature = "pi")]
+    fn channel(channel: u8) -> Result<Channel> {
+        match channel {
+            0 => Ok(Channel::Channel0),
+            1 => Ok(Channel::Channel1),
+            2 => Ok(Channel::Channel2),
+            3 => Ok(Channel::Channel3),
+            4 => Ok(Channel::Channel4),
+            5 => Ok(Channel::Channel5),
+            _ => Err(anyhow::anyhow!("Invalid channel: {}", channel)),
+        }
     }
-}
 
-impl Maestro {
     #[cfg(feature = "pi")]
-    pub fn set_target(&mut self, channel: u8, pwm_value: u16) -> Result<()> {
-        let ch = match channel {
-            0 => Channel::Channel0,
-            1 => Channel::Channel1,
-            2 => Channel::Channel2,
-            3 => Channel::Channel3,
-            4 => Channel::Channel4,
-            5 => Channel::Channel5,
-            _ => return Err(anyhow::anyhow!("Invalid channel: {}", channel)),
-        };
-        self.controller.set_target(ch, pwm_value)?;
+    fn write(&mut self, channel: u8, pwm_value: u16) -> Result<()> {
+        self.controller.set_target(Self::channel(channel)?, pwm_value)?;
         Ok(())
     }
 
     #[cfg(not(feature = "pi"))]
-    pub fn set_target(&mut self, channel: u8, pwm_value: u16) -> Result<()> {
-        if channel > 5 {
-            return Err(anyhow::anyhow!("Invalid channel: {}", channel));
-        }
+    fn write(&mut self, channel: u8, pwm_value: u16) -> Result<()> {
         self.pwm_values[channel as usize] = pwm_value;
         Ok(())
     }
 
     #[cfg(feature = "pi")]
-    pub fn current_pwm(&self, channel: u8) -> Result<u16> {
-        let ch = match channel {
-            0 => Channel::Channel0,
-            1 => Channel::Channel1,
-            2 => Channel::Channel2,
-            3 => Channel::Channel3,
-            4 => Channel::Channel4,
-            5 => Channel::Channel5,
-            _ => return Err(anyhow::anyhow!("Invalid channel: {}", channel)),
-        };
-        Ok(self.controller.get_position(ch)?)
+    fn read(&mut self, channel: u8) -> Result<u16> {
+        Ok(self.controller.get_position(Self::channel(channel)?)?)
     }
 
     #[cfg(not(feature = "pi"))]
-    pub fn current_pwm(&self, channel: u8) -> Result<u16> {
-        if channel > 5 {
-            return Err(anyhow::anyhow!("Invalid channel: {}", channel));
-        }
+    fn read(&mut self, channel: u8) -> Result<u16> {
         Ok(self.pwm_values[channel as usize])
     }
+}
 
-    pub fn move_to_grip(&mut self, grip_type: &str) -> Result<()> {
-        // Define grip positions (PWM values for each servo)
-        // These are example values - should be calibrated for actual hardware
-        match grip_type {
-            "rest" => {
-                self.set_target(0, 1500)?;
-                self.set_target(1, 1500)?;
-                self.set_target(2, 1500)?;
+/// Tickets `first..=last` were flushed in batches whose write failed
+struct Failure {
+    first: u64,
+    last: u64,
+    error: String,
+}
+
+/// Targets waiting to be written. Only the latest target per channel is
+/// kept, so a burst of commands collapses into one serial write each.
+struct CommandQueue {
+    pending: [Option<u16>; NUM_CHANNELS],
+    submitted: u64,
+    completed: u64,
+    failures: VecDeque<Failure>,
+    shutdown: bool,
+}
+
+impl CommandQueue {
+    fn has_pending(&self) -> bool {
+        self.pending.iter().any(|target| target.is_some())
+    }
+
+    /// Record that every ticket in `first..=last` failed to write
+    fn record_failure(&mut self, first: u64, last: u64, error: String) {
+        if let Some(previous) = self.failures.back_mut() {
+            if previous.last + 1 == first && previous.error == error {
+                previous.last = last;
+                return;
+            }
+        }
+        if self.failures.len() == MAX_FAILURES {
+            self.failures.pop_front();
+        }
+        self.failures.push_back(Failure { first, last, error });
+    }
+
+    /// Ok(true) once `ticket` was written, Ok(false) while pending, Err if
+    /// its batch failed. Failures older than the last MAX_FAILURES ranges
+    /// are forgotten and report success.
+    fn status(&self, ticket: u64) -> Result<bool> {
+        if self.completed < ticket {
+            return Ok(false);
+        }
+        match self
+            .failures
+            .iter()
+            .rev()
+            .find(|failure| failure.first <= ticket && ticket <= failure.last)
+        {
+            Some(failure) => Err(anyhow::anyhow!("{}", failure.error)),
+            None => Ok(true),
+        }
+    }
+}
+
+struct Shared {
+    queue: Mutex<CommandQueue>,
+    wake: Condvar,
+    done: Condvar,
+    driver: Mutex<Driver>,
+    interlock: Mutex<Option<Arc<StateCell>>>,
+}
+
+pub struct Maestro {
+    shared: Arc<Shared>,
+    worker: Option<JoinHandle<()>>,
+}
+
+impl Resource for Maestro {
+    fn init() -> Self {
+        let shared = Arc::new(Shared {
+            queue: Mutex::new(CommandQueue {
+                pending: [None; NUM_CHANNELS],
+                submitted: 0,
+                completed: 0,
+                failures: VecDeque::new(),
+                shutdown: false,
+            }),
+            wake: Condvar::new(),
+            done: Condvar::new(),
+            driver: Mutex::new(Driver::init()),
+            interlock: Mutex::new(None),
+        });
+
+        let worker_shared = Arc::clone(&shared);
+        let worker = thread::Builder::new()
+            .name("maestro-flush".to_string())
+            .spawn(move || flush_loop(worker_shared))
+            .expect("Could not spawn Maestro flush thread");
+
+        Maestro {
+            shared,
+            worker: Some(worker),
+        }
+    }
+
+    fn name() -> String {
+        "Maestro".to_string()
+    }
+}
+
+/// Drain coalesced targets to the serial bus until shutdown. Pending
+/// targets are always flushed before the thread exits. A failed write
+/// trips the attached state interlock straight to ERROR.
+fn flush_loop(shared: Arc<Shared>) {
+    loop {
+        let (batch, ticket) = {
+            let mut queue = shared.queue.lock().unwrap();
+            while !queue.has_pending() && !queue.shutdown {
+                queue = shared.wake.wait(queue).unwrap();
             }
-            "pinch" => {
-                self.set_target(0, 2000)?;
-                self.set_target(1, 1800)?;
-                self.set_target(2, 1500)?;
+            if !queue.has_pending() {
+                return;
             }
-            "power" => {
-                self.set_target(0, 2200)?;
-                self.set_target(1, 2200)?;
-                self.set_target(2, 2200)?;
+            (std::mem::replace(&mut queue.pending, [None; NUM_CHANNELS]), queue.submitted)
+        };
+
+        let mut result = Ok(());
+        {
+            let mut driver = shared.driver.lock().unwrap();
+            for (channel, target) in batch.iter().enumerate() {
+                if let Some(pwm_value) = target {
+                    if let Err(e) = driver.write(channel as u8, *pwm_value) {
+                        result = Err(e);
+                    }
+                }
             }
-            "open" => {
-                self.set_target(0, 1000)?;
-                self.set_target(1, 1000)?;
-                self.set_target(2, 1000)?;
+        }
+
+        if let Err(e) = &result {
+            if let Some(cell) = shared.interlock.lock().unwrap().as_ref() {
+                cell.trip(&format!("Servo write failed: {}", e));
             }
-            _ => return Err(anyhow::anyhow!("Unknown grip type: {}", grip_type)),
         }
-        Ok(())
+
+        let mut queue = shared.queue.lock().unwrap();
+        if let Err(e) = result {
+            // Coalesced commands share one write, so every ticket since the
+            // last flush failed with it
+            let first = queue.completed + 1;
+            queue.record_failure(first, ticket, e.to_string());
+        }
+        queue.completed = ticket;
+        shared.done.notify_all();
+    }
+}
+
+fn check_channel(channel: u8) -> Result<()> {
+    if channel as usize >= NUM_CHANNELS {
+        return Err(anyhow::anyhow!("Invalid channel: {}", channel));
+    }
+    Ok(())
+}
+
+impl Maestro {
+    /// Queue a target for one channel and return its completion ticket
+    pub fn set_target(&self, channel: u8, pwm_value: u16) -> Result<u64> {
+        self.set_targets(&[(channel, pwm_value)])
+    }
+
+    /// Queue several targets as one batch and return its completion ticket.
+    /// Replaces any not-yet-flushed target on the same channel.
+    pub fn set_targets(&self, targets: &[(u8, u16)]) -> Result<u64> {
+        for &(channel, _) in targets {
+            check_channel(channel)?;
+        }
+
+        let mut queue = self.shared.queue.lock().unwrap();
+        for &(channel, pwm_value) in targets {
+            queue.pending[channel as usize] = Some(pwm_value);
+        }
+        queue.submitted += 1;
+        let ticket = queue.submitted;
+        self.shared.wake.notify_one();
+        Ok(ticket)
+    }
+
+    /// Trip `cell` to ERROR whenever a servo write fails
+    pub fn attach_interlock(&self, cell: Arc<StateCell>) {
+        *self.shared.interlock.lock().unwrap() = Some(cell);
+    }
+
+    /// Ok(true) once `ticket` has been written, Ok(false) while it is
+    /// still queued, Err if the write carrying it failed
+    pub fn is_done(&self, ticket: u64) -> Result<bool> {
+        self.shared.queue.lock().unwrap().status(ticket)
+    }
+
+    /// Block until `ticket` has been written or `timeout` elapses.
+    ///
+    /// Returns Ok(false) on timeout and Err if the write carrying `ticket`
+    /// failed. A timeout too far out to represent as an Instant waits
+    /// indefinitely.
+    pub fn wait(&self, ticket: u64, timeout: Duration) -> Result<bool> {
+        let deadline = Instant::now().checked_add(timeout);
+        let mut queue = self.shared.queue.lock().unwrap();
+        while queue.completed < ticket {
+            queue = match deadline {
+                Some(deadline) => {
+                    let now = Instant::now();
+                    if now >= deadline {
+                        return Ok(false);
+                    }
+                    self.shared.done.wait_timeout(queue, deadline - now).unwrap().0
+                }
+                None => self.shared.done.wait(queue).unwrap(),
+            };
+        }
+        queue.status(ticket)
+    }
+
+    /// Block until everything queued so far has been written
+    pub fn flush(&self, timeout: Duration) -> Result<bool> {
+        let ticket = self.shared.queue.lock().unwrap().submitted;
+        self.wait(ticket, timeout)
+    }
+
+    pub fn current_pwm(&self, channel: u8) -> Result<u16> {
+        check_channel(channel)?;
+        self.shared.driver.lock().unwrap().read(channel)
+    }
+
+    /// Read back every channel under a single driver lock
+    pub fn positions(&self) -> Result<Vec<u16>> {
+        let mut driver = self.shared.driver.lock().unwrap();
+        (0..NUM_CHANNELS as u8).map(|channel| driver.read(channel)).collect()
+    }
+
+    pub fn move_to_grip(&self, grip_type: &str) -> Result<u64> {
+        // Define grip positions (PWM values for each servo)
+        // These are example values - should be calibrated for actual hardware
+        match grip_type {
+            "rest" => self.set_targets(&[(0, 1500), (1, 1500), (2, 1500)]),
+            "pinch" => self.set_targets(&[(0, 2000), (1, 1800), (2, 1500)]),
+            "power" => self.set_targets(&[(0, 2200), (1, 2200), (2, 2200)]),
+            "open" => self.set_targets(&[(0, 1000), (1, 1000), (2, 1000)]),
+            _ => Err(anyhow::anyhow!("Unknown grip type: {}", grip_type)),
+        }
+    }
+}
+
+impl Drop for Maestro {
+    fn drop(&mut self) {
+        self.shared.queue.lock().unwrap().shutdown = true;
+        self.shared.wake.notify_one();
+        if let Some(worker) = self.worker.take() {
+            let _ = worker.join();
+        }
     }
 }
@@ -19,10 +19,13 @@ use pyo3::prelude::*;
 //       use gpm_original::resources::*;
 mod hardware;
 
+// Native arm state shared with the Python StateMachine
+mod state;
+
 // Python bindings layer - wraps hardware implementations
 mod python_bindings;
 
-use python_bindings::{bms, emg, fsr, maestro};
+use python_bindings::{bms, emg, fsr, maestro, state as state_bindings};
 
 /// Grasp Primary Module - Hardware interface
 /// 
@@ -36,6 +39,7 @@ fn gpm(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<bms::BmsStatus>()?;
     m.add_class::<fsr::Fsr>()?;
     m.add_class::<fsr::FsrReading>()?;
+    m.add_class::<state_bindings::StateCell>()?;
 
     Ok(())
 }
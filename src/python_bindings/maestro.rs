@@ -1,4 +1,5 @@
 use pyo3::prelude::*;
+use std::time::Duration;
 
 // TODO: Once gpm_original is added as dependency/submodule:
 // use gpm_original::resources::Maestro as RustMaestro;
@@ -7,6 +8,17 @@ use pyo3::prelude::*;
 // Temporary: using local hardware module
 use crate::hardware::maestro::Maestro as RustMaestro;
 use crate::hardware::Resource;
+use crate::python_bindings::state::StateCell;
+
+/// Convert a Python timeout in seconds; negative means don't wait
+fn timeout_duration(timeout: f64) -> PyResult<Duration> {
+    if timeout <= 0.0 {
+        return Ok(Duration::ZERO);
+    }
+    Duration::try_from_secs_f64(timeout).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid timeout {}: {}", timeout, e))
+    })
+}
 
 /// Python-exposed Maestro servo controller
 #[pyclass(name = "Maestro")]
@@ -23,27 +35,115 @@ impl Maestro {
         Ok(Maestro { inner })
     }
 
-    /// Set target PWM for a servo channel
+    /// Queue target PWM for a servo channel
+    ///
+    /// The write happens on a background flush thread; pending targets for
+    /// the same channel are coalesced so only the latest is sent.
     ///
     /// Args:
     ///     channel: Servo channel (0-5)
     ///     pwm_value: PWM value (typically 1000-2000)
-    pub fn set_target(&mut self, channel: u8, pwm_value: u16) -> PyResult<()> {
+    ///
+    /// Returns:
+    ///     Completion ticket for is_done()/wait()
+    pub fn set_target(&self, channel: u8, pwm_value: u16) -> PyResult<u64> {
         self.inner
             .set_target(channel, pwm_value)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Maestro error: {}", e)))
     }
 
-    /// Move to predefined grip type
+    /// Queue targets for several channels as one batch
+    ///
+    /// Args:
+    ///     targets: List of (channel, pwm_value) pairs
+    ///
+    /// Returns:
+    ///     Completion ticket for is_done()/wait()
+    pub fn set_targets(&self, targets: Vec<(u8, u16)>) -> PyResult<u64> {
+        self.inner
+            .set_targets(&targets)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Maestro error: {}", e)))
+    }
+
+    /// Queue a predefined grip type
     ///
     /// Args:
     ///     grip_type: One of "rest", "pinch", "power", "open"
-    pub fn move_to_grip(&mut self, grip_type: &str) -> PyResult<()> {
+    ///
+    /// Returns:
+    ///     Completion ticket for is_done()/wait()
+    pub fn move_to_grip(&self, grip_type: &str) -> PyResult<u64> {
         self.inner
             .move_to_grip(grip_type)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Move failed: {}", e)))
     }
 
+    /// Trip a state cell to ERROR whenever a servo write fails
+    ///
+    /// Args:
+    ///     cell: StateCell shared with the application StateMachine
+    pub fn attach_interlock(&self, cell: PyRef<'_, StateCell>) {
+        self.inner.attach_interlock(cell.inner.clone());
+    }
+
+    /// Check whether a queued command has been written
+    ///
+    /// Args:
+    ///     ticket: Ticket returned by set_target/set_targets/move_to_grip
+    ///
+    /// Returns:
+    ///     True once the command (and everything before it) was sent
+    ///
+    /// Raises:
+    ///     RuntimeError: If the write carrying this ticket failed
+    pub fn is_done(&self, ticket: u64) -> PyResult<bool> {
+        self.inner
+            .is_done(ticket)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Maestro error: {}", e)))
+    }
+
+    /// Wait for a queued command to be written
+    ///
+    /// Args:
+    ///     ticket: Ticket returned by set_target/set_targets/move_to_grip
+    ///     timeout: Maximum time to wait in seconds
+    ///
+    /// Returns:
+    ///     True if written, False on timeout
+    ///
+    /// Raises:
+    ///     RuntimeError: If the write carrying this ticket failed
+    ///     ValueError: If timeout is NaN or too large to represent
+    #[pyo3(signature = (ticket, timeout=1.0))]
+    pub fn wait(&self, py: Python<'_>, ticket: u64, timeout: f64) -> PyResult<bool> {
+        let timeout = timeout_duration(timeout)?;
+        py.allow_threads(|| {
+            self.inner
+                .wait(ticket, timeout)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Maestro error: {}", e)))
+        })
+    }
+
+    /// Wait for every queued command to be written
+    ///
+    /// Args:
+    ///     timeout: Maximum time to wait in seconds
+    ///
+    /// Returns:
+    ///     True if the queue drained, False on timeout
+    ///
+    /// Raises:
+    ///     ValueError: If timeout is NaN or too large to represent
+    #[pyo3(signature = (timeout=1.0))]
+    pub fn flush(&self, py: Python<'_>, timeout: f64) -> PyResult<bool> {
+        let timeout = timeout_duration(timeout)?;
+        py.allow_threads(|| {
+            self.inner
+                .flush(timeout)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Maestro error: {}", e)))
+        })
+    }
+
     /// Get current PWM value for channel
     ///
     /// Args:
@@ -56,4 +156,16 @@ impl Maestro {
             .current_pwm(channel)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Read failed: {}", e)))
     }
+
+    /// Get current PWM values for all channels in one call
+    ///
+    /// Returns:
+    ///     List of PWM values indexed by channel
+    pub fn positions(&self, py: Python<'_>) -> PyResult<Vec<u16>> {
+        py.allow_threads(|| {
+            self.inner
+                .positions()
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Read failed: {}", e)))
+        })
+    }
 }
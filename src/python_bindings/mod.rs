@@ -2,3 +2,4 @@ pub mod maestro;
 pub mod emg;
 pub mod fsr;
 pub mod bms;
+pub mod state;
@@ -0,0 +1,90 @@
+use pyo3::prelude::*;
+use std::sync::Arc;
+
+use crate::state::{self, StateCell as RustStateCell};
+
+/// Python-exposed arm state cell shared with native components
+#[pyclass(name = "StateCell")]
+pub struct StateCell {
+    pub(crate) inner: Arc<RustStateCell>,
+}
+
+#[pymethods]
+impl StateCell {
+    /// Create a cell in the INITIALIZING state
+    #[new]
+    pub fn new() -> PyResult<Self> {
+        Ok(StateCell {
+            inner: Arc::new(RustStateCell::new()),
+        })
+    }
+
+    /// Get current state code
+    ///
+    /// Returns:
+    ///     Index into application.state_machine.STATES
+    pub fn get(&self) -> u8 {
+        self.inner.get()
+    }
+
+    /// Transition from an expected state to a new one
+    ///
+    /// Args:
+    ///     from_state: State code the caller believes is current
+    ///     to_state: Target state code
+    ///
+    /// Returns:
+    ///     True if the transition is valid and the state was still from_state
+    pub fn compare_transition(&self, from_state: u8, to_state: u8) -> bool {
+        self.inner.compare_transition(from_state, to_state)
+    }
+
+    /// Transition from the current state, if allowed
+    ///
+    /// Args:
+    ///     to_state: Target state code
+    ///
+    /// Returns:
+    ///     Previous state code, or None if the transition is invalid
+    pub fn transition(&self, to_state: u8) -> Option<u8> {
+        self.inner.transition(to_state)
+    }
+
+    /// Force the ERROR state
+    ///
+    /// Args:
+    ///     reason: Why the arm was tripped, reported by trip_reason()
+    ///
+    /// Returns:
+    ///     True if the cell moved to ERROR
+    #[pyo3(signature = (reason="Safety trip"))]
+    pub fn trip(&self, reason: &str) -> bool {
+        self.inner.trip(reason)
+    }
+
+    /// Reason given for the most recent successful trip
+    ///
+    /// Returns:
+    ///     Reason string, or None if the cell was never tripped
+    pub fn trip_reason(&self) -> Option<String> {
+        self.inner.trip_reason()
+    }
+
+    /// Number of successful safety trips
+    pub fn trip_count(&self) -> u64 {
+        self.inner.trip_count()
+    }
+
+    /// Check a transition against the native table
+    ///
+    /// Args:
+    ///     from_state: Source state code
+    ///     to_state: Target state code
+    ///
+    /// Returns:
+    ///     True if allowed
+    #[staticmethod]
+    pub fn is_valid(from_state: u8, to_state: u8) -> bool {
+        state::is_valid(from_state, to_state)
+    }
+}
@@ -0,0 +1,104 @@
+// Native arm state cell shared between Python and native components
+//
+// State codes and the transition table mirror application/state_machine.py
+// (ArmState declaration order). Keep the two in sync.
+use std::sync::atomic::{AtomicU64, AtomicU8, Ordering};
+use std::sync::Mutex;
+
+pub const INITIALIZING: u8 = 0;
+pub const IDLE: u8 = 1;
+pub const ACTIVE: u8 = 2;
+pub const CALIBRATING: u8 = 3;
+pub const ERROR: u8 = 4;
+pub const SHUTDOWN: u8 = 5;
+
+pub const NUM_STATES: usize = 6;
+
+const fn bit(state: u8) -> u8 {
+    1 << state
+}
+
+/// TRANSITIONS[from] has bit `to` set if the transition is allowed
+pub const TRANSITIONS: [u8; NUM_STATES] = [
+    bit(IDLE) | bit(ERROR),                                      // INITIALIZING
+    bit(ACTIVE) | bit(CALIBRATING) | bit(SHUTDOWN) | bit(ERROR), // IDLE
+    bit(IDLE) | bit(ERROR) | bit(SHUTDOWN),                      // ACTIVE
+    bit(IDLE) | bit(ERROR),                                      // CALIBRATING
+    bit(IDLE) | bit(SHUTDOWN),                                   // ERROR
+    0,                                                           // SHUTDOWN
+];
+
+pub fn is_valid(from: u8, to: u8) -> bool {
+    (from as usize) < NUM_STATES && (to as usize) < NUM_STATES && TRANSITIONS[from as usize] & bit(to) != 0
+}
+
+pub struct StateCell {
+    state: AtomicU8,
+    trips: AtomicU64,
+    trip_reason: Mutex<Option<String>>,
+}
+
+impl StateCell {
+    pub fn new() -> Self {
+        StateCell {
+            state: AtomicU8::new(INITIALIZING),
+            trips: AtomicU64::new(0),
+            trip_reason: Mutex::new(None),
+        }
+    }
+
+    pub fn get(&self) -> u8 {
+        self.state.load(Ordering::Acquire)
+    }
+
+    /// Move from exactly `from` to `to`. Fails if the transition is not in
+    /// the table or another thread changed the state first.
+    pub fn compare_transition(&self, from: u8, to: u8) -> bool {
+        is_valid(from, to)
+            && self
+                .state
+                .compare_exchange(from, to, Ordering::AcqRel, Ordering::Acquire)
+                .is_ok()
+    }
+
+    /// Move to `to` from whatever the current state is, if allowed.
+    /// Returns the previous state on success.
+    pub fn transition(&self, to: u8) -> Option<u8> {
+        let mut current = self.get();
+        loop {
+            if !is_valid(current, to) {
+                return None;
+            }
+            match self
+                .state
+                .compare_exchange_weak(current, to, Ordering::AcqRel, Ordering::Acquire)
+            {
+                Ok(previous) => return Some(previous),
+                Err(actual) => current = actual,
+            }
+        }
+    }
+
+    /// Safety trip: force ERROR from any state that allows it, recording
+    /// why. The reason lock is held across the transition so a reader that
+    /// sees ERROR also sees its reason.
+    pub fn trip(&self, reason: &str) -> bool {
+        let mut trip_reason = self.trip_reason.lock().unwrap();
+        if self.transition(ERROR).is_some() {
+            *trip_reason = Some(reason.to_string());
+            self.trips.fetch_add(1, Ordering::Relaxed);
+            true
+        } else {
+            false
+        }
+    }
+
+    /// Reason given for the most recent successful trip
+    pub fn trip_reason(&self) -> Option<String> {
+        self.trip_reason.lock().unwrap().clone()
+    }
+
+    pub fn trip_count(&self) -> u64 {
+        self.trips.load(Ordering::Relaxed)
+    }
+}
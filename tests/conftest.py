@@ -0,0 +1,12 @@
+import signal
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def restore_signal_handlers():
+    """ArmController installs process-wide handlers; undo that after each test"""
+    previous = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    yield
+    for sig, handler in previous.items():
+        signal.signal(sig, handler)
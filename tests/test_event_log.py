@@ -0,0 +1,85 @@
+import io
+
+import pytest
+
+from application.event_log import EventLevel, EventLog
+
+
+def make_log(level=EventLevel.INFO, capacity=8):
+    stream = io.StringIO()
+    return EventLog(level=level, capacity=capacity, stream=stream), stream
+
+
+def test_filters_events_below_level():
+    log, stream = make_log(level=EventLevel.WARNING)
+
+    log.debug("test", "debug")
+    log.info("test", "info")
+    log.warning("test", "warning %d", 1)
+    log.error("test", "error %s", "two")
+
+    assert log.drain() == 2
+    lines = stream.getvalue().splitlines()
+    assert [line.split(" ", 1)[1] for line in lines] == [
+        "WARNING [test] warning 1",
+        "ERROR   [test] error two",
+    ]
+
+
+def test_formatting_is_deferred_until_drain():
+    log, stream = make_log()
+    payload = {"value": 1}
+
+    log.info("test", "payload %s", payload)
+    payload["value"] = 2
+    log.drain()
+
+    assert "payload {'value': 2}" in stream.getvalue()
+
+
+def test_bad_format_does_not_raise():
+    log, stream = make_log()
+
+    log.info("test", "%d items", "many")
+    log.drain()
+
+    assert "%d items ('many',)" in stream.getvalue()
+
+
+def test_full_buffer_counts_dropped_events():
+    log, stream = make_log(capacity=3)
+
+    for i in range(5):
+        log.info("test", "event %d", i)
+
+    assert log.dropped == 2
+    assert log.drain() == 3
+    output = stream.getvalue()
+    assert "event 2" in output and "event 3" not in output
+    assert "2 events dropped" in output
+    assert log.dropped == 0
+
+
+def test_close_drains_pending_events():
+    log, stream = make_log()
+    log.start()
+
+    log.info("test", "last words")
+    log.close()
+
+    assert "last words" in stream.getvalue()
+
+
+@pytest.mark.parametrize("name, level", [
+    ("info", EventLevel.INFO),
+    ("WARN", EventLevel.WARNING),
+    ("CRITICAL", EventLevel.ERROR),
+    ("NOTSET", EventLevel.DEBUG),
+])
+def test_parse_accepts_logging_names(name, level):
+    assert EventLevel.parse(name) == level
+
+
+def test_parse_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        EventLevel.parse("verbose")
@@ -0,0 +1,65 @@
+import pytest
+
+from application.gesture_filter import GestureFilter
+from application.grip_controller import GripType
+
+
+def feed(gesture_filter, decisions, start=0.0, step=0.01):
+    """Feed decisions at a fixed rate and return the emitted changes"""
+    return [gesture_filter.update(decision, now=start + i * step) for i, decision in enumerate(decisions)]
+
+
+def test_majority_vote_switches_after_required_votes():
+    gesture_filter = GestureFilter(window_size=5, vote_threshold=0.6, min_dwell_time=0.0)
+
+    changes = feed(gesture_filter, [GripType.POWER] * 3)
+
+    assert changes == [None, None, GripType.POWER]
+    assert gesture_filter.get_current_grip() == GripType.POWER
+
+
+def test_isolated_misclassifications_are_ignored():
+    gesture_filter = GestureFilter(window_size=5, vote_threshold=0.6, min_dwell_time=0.0)
+
+    changes = feed(gesture_filter, [GripType.OPEN, None, GripType.POWER, None, GripType.OPEN])
+
+    assert changes == [None] * 5
+    assert gesture_filter.get_current_grip() == GripType.REST
+
+
+def test_hysteresis_holds_current_grip_on_split_vote():
+    gesture_filter = GestureFilter(window_size=5, vote_threshold=0.6, min_dwell_time=0.0)
+    feed(gesture_filter, [GripType.POWER] * 5)
+
+    # OPEN leads POWER 2 to 1 but never reaches 3 of 5 votes
+    changes = feed(gesture_filter, [GripType.OPEN, GripType.OPEN, None, None], start=1.0)
+
+    assert changes == [None] * 4
+    assert gesture_filter.get_current_grip() == GripType.POWER
+
+
+def test_min_dwell_time_delays_next_change():
+    gesture_filter = GestureFilter(window_size=1, vote_threshold=1.0, min_dwell_time=0.3)
+
+    assert gesture_filter.update(GripType.POWER, now=0.0) == GripType.POWER
+    assert gesture_filter.update(GripType.OPEN, now=0.1) is None
+    assert gesture_filter.update(GripType.OPEN, now=0.3) == GripType.OPEN
+
+
+def test_reset_clears_votes_and_resyncs_grip():
+    gesture_filter = GestureFilter(window_size=5, vote_threshold=0.6, min_dwell_time=1.0)
+    feed(gesture_filter, [GripType.POWER] * 3)
+    feed(gesture_filter, [GripType.OPEN] * 2, start=0.05)
+
+    gesture_filter.reset(GripType.PINCH)
+
+    assert gesture_filter.get_current_grip() == GripType.PINCH
+    # Votes from before the reset no longer count
+    assert gesture_filter.update(GripType.OPEN, now=0.1) is None
+    assert feed(gesture_filter, [GripType.OPEN] * 2, start=0.11)[-1] == GripType.OPEN
+
+
+@pytest.mark.parametrize("window_size, vote_threshold", [(0, 0.6), (5, 0.5), (5, 1.1)])
+def test_rejects_invalid_parameters(window_size, vote_threshold):
+    with pytest.raises(ValueError):
+        GestureFilter(window_size=window_size, vote_threshold=vote_threshold)
@@ -0,0 +1,61 @@
+import pytest
+
+from application.grip_controller import GripController, GripState, GripType
+from application.hardware import HardwareInterface
+from application.simulation import SimClock
+
+
+@pytest.fixture
+def hardware():
+    return HardwareInterface({'backend': 'sim', 'sim_seed': 0}, clock=SimClock())
+
+
+def test_poll_motion_confirms_written_grip(hardware):
+    controller = GripController(hardware)
+
+    assert controller.poll_motion() is None
+    assert controller.execute_grip(GripType.POWER)
+    assert controller.poll_motion() is None  # still queued
+
+    hardware.sim.clock.sleep(0.1)
+
+    assert controller.poll_motion() is True
+    assert controller.confirmed_grip == GripType.POWER
+    assert controller.poll_motion() is None
+
+
+def test_wait_for_motion_confirms_written_grip(hardware):
+    controller = GripController(hardware)
+
+    controller.execute_grip(GripType.OPEN)
+
+    assert controller.wait_for_motion()
+    assert controller.get_current_grip() == GripType.OPEN
+    assert controller.confirmed_grip == GripType.OPEN
+
+
+def test_failed_write_reverts_to_confirmed_grip(hardware):
+    controller = GripController(hardware)
+    controller.execute_grip(GripType.OPEN)
+    controller.wait_for_motion()
+
+    hardware.sim.inject_fault('servo_bus')
+    assert controller.execute_grip(GripType.POWER)
+    assert controller.get_current_grip() == GripType.POWER
+
+    hardware.sim.clock.sleep(0.1)
+
+    assert controller.poll_motion() is False
+    assert controller.get_current_grip() == GripType.OPEN
+    assert controller.get_state() == GripState.IDLE
+
+
+def test_wait_for_motion_reports_failed_write(hardware):
+    controller = GripController(hardware)
+    hardware.sim.inject_fault('servo_bus')
+
+    controller.execute_grip(GripType.PINCH)
+
+    assert not controller.wait_for_motion()
+    assert controller.get_current_grip() == GripType.REST
+    assert controller.confirmed_grip == GripType.REST
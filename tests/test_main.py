@@ -0,0 +1,87 @@
+import signal
+import threading
+
+import pytest
+
+from application.simulation import SimClock
+from application.state_machine import ArmState, STATE_CODES
+from main import ArmController
+
+
+@pytest.fixture
+def controller():
+    return ArmController({'backend': 'sim', 'sim_seed': 0}, clock=SimClock())
+
+
+def test_signal_handler_only_stops_the_loop(controller):
+    controller.running = True
+
+    # Simulate the signal interrupting the main thread inside EventLog._record
+    with controller.events._lock:
+        handler = threading.Thread(target=controller._signal_handler, args=(signal.SIGINT, None))
+        handler.start()
+        handler.join(timeout=1.0)
+        deadlocked = handler.is_alive()
+
+    assert not deadlocked
+    assert not controller.running
+
+
+def test_signal_handler_interrupts_when_idle(controller):
+    with pytest.raises(KeyboardInterrupt):
+        controller._signal_handler(signal.SIGINT, None)
+
+
+def test_stop_request_ends_control_loop(controller):
+    assert controller.initialize()
+    controller.clock.call_at(1.0, lambda: controller._signal_handler(signal.SIGTERM, None))
+
+    controller.process_emg_stream()
+
+    assert controller.clock.monotonic() == pytest.approx(1.0, abs=0.05)
+    assert controller.state_machine.get_state() == ArmState.IDLE
+
+
+class RecordingSink:
+    def __init__(self):
+        self.records = []
+
+    def push(self, record):
+        self.records.append(record)
+        return True
+
+
+def test_publishes_one_full_telemetry_record_per_iteration(controller):
+    from application.pipeline import TELEMETRY_FIELDS
+
+    sink = RecordingSink()
+    controller.telemetry = [sink]
+    assert controller.initialize()
+    controller.clock.call_at(0.5, lambda: setattr(controller, 'running', False))
+
+    controller.process_emg_stream()
+
+    assert len(sink.records) == pytest.approx(50, abs=2)
+    record = dict(zip(TELEMETRY_FIELDS, sink.records[-1]))
+    assert len(sink.records[-1]) == len(TELEMETRY_FIELDS)
+    assert record['emg_ready'] == 1.0
+    assert record['state'] == STATE_CODES[ArmState.ACTIVE]
+
+
+def test_recover_waits_for_servo_bus_to_clear(controller):
+    world = controller.hardware.sim
+    assert controller.initialize()
+    controller.clock.call_at(5.0, lambda: world.inject_fault('servo_bus'))
+    controller.clock.call_at(60.0, lambda: setattr(controller, 'running', False))
+
+    controller.process_emg_stream()
+
+    assert controller.state_machine.get_state() == ArmState.ERROR
+    assert controller.state_machine.get_error_message().startswith("Servo write failed")
+    assert not controller.recover()
+    assert controller.state_machine.get_state() == ArmState.ERROR
+
+    world.inject_fault('servo_bus', active=False)
+
+    assert controller.recover()
+    assert controller.state_machine.get_state() == ArmState.IDLE
@@ -0,0 +1,115 @@
+import multiprocessing
+
+import pytest
+
+from application.pipeline import SharedRing, TELEMETRY_FIELDS
+
+
+def make_ring(capacity):
+    return SharedRing(num_fields=2, capacity=capacity)
+
+
+def test_push_pop_round_trip():
+    ring = make_ring(4)
+    try:
+        assert ring.push((1.0, 2.0))
+        assert ring.push((3.0, 4.0))
+
+        assert ring.pop_all() == [(1.0, 2.0), (3.0, 4.0)]
+        assert ring.pop_all() == []
+    finally:
+        ring.close()
+
+
+def test_wraps_around_capacity():
+    ring = make_ring(3)
+    try:
+        for i in range(10):
+            assert ring.push((float(i), -float(i)))
+            assert ring.pop_all() == [(float(i), -float(i))]
+        assert ring.dropped == 0
+    finally:
+        ring.close()
+
+
+def test_full_ring_drops_newest_records():
+    ring = make_ring(3)
+    try:
+        results = [ring.push((float(i), 0.0)) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert ring.dropped == 2
+        assert [record[0] for record in ring.pop_all()] == [0.0, 1.0, 2.0]
+        assert ring.push((5.0, 0.0))
+    finally:
+        ring.close()
+
+
+def test_push_drops_instead_of_waiting_for_consumer():
+    ring = make_ring(3)
+    try:
+        with ring.lock:
+            assert not ring.push((1.0, 1.0))
+        assert ring.dropped == 1
+        assert ring.pop_all() == []
+    finally:
+        ring.close()
+
+
+def test_consumer_attaches_by_handle():
+    producer = SharedRing(capacity=8)
+    consumer = SharedRing.attach(producer.handle())
+    try:
+        assert consumer.capacity == 8
+        assert consumer.num_fields == len(TELEMETRY_FIELDS)
+
+        record = tuple(float(i) for i in range(len(TELEMETRY_FIELDS)))
+        producer.push(record)
+        assert consumer.pop_all() == [record]
+    finally:
+        consumer.close()
+        producer.close()
+
+
+def test_attach_without_lock_is_rejected():
+    ring = make_ring(3)
+    try:
+        with pytest.raises(ValueError):
+            SharedRing(name=ring.name)
+    finally:
+        ring.close()
+
+
+def _produce(handle, count, results):
+    ring = SharedRing.attach(handle)
+    try:
+        for i in range(count):
+            # Retry drops so every record has to make it across intact
+            while not ring.push((float(i),) * ring.num_fields):
+                pass
+        results.put(ring.dropped)
+    finally:
+        ring.close()
+
+
+def test_records_stay_intact_across_processes():
+    count = 5000
+    ctx = multiprocessing.get_context('spawn')
+    ring = SharedRing(num_fields=8, capacity=64)
+    results = ctx.Queue()
+    producer = ctx.Process(target=_produce, args=(ring.handle(), count, results))
+    received = []
+    try:
+        producer.start()
+        while producer.is_alive():
+            received.extend(ring.pop_all())
+        producer.join()
+        received.extend(ring.pop_all())
+        assert producer.exitcode == 0
+        retries = results.get(timeout=5.0)
+    finally:
+        ring.close()
+
+    assert all(len(set(record)) == 1 for record in received), "torn record"
+    assert [record[0] for record in received] == [float(i) for i in range(count)]
+    assert retries > 0, "ring never filled or contended"
@@ -0,0 +1,104 @@
+from application.simulation import SimClock, SimStateCell
+from application.state_machine import (
+    ArmState,
+    STATE_CODES,
+    STATES,
+    StateMachine,
+    StateTransition,
+)
+
+
+def test_masks_match_transition_table():
+    for from_state in STATES:
+        for to_state in STATES:
+            expected = to_state in StateTransition.VALID_TRANSITIONS[from_state]
+            assert StateTransition.is_valid(from_state, to_state) == expected
+
+
+def test_rejects_invalid_transition():
+    machine = StateMachine()
+
+    assert not machine.transition_to(ArmState.ACTIVE)
+    assert machine.get_state() == ArmState.INITIALIZING
+
+
+def test_operational_only_in_idle_and_active():
+    machine = StateMachine()
+    assert not machine.is_operational()
+
+    machine.transition_to(ArmState.IDLE)
+    assert machine.is_operational()
+    machine.transition_to(ArmState.ACTIVE)
+    assert machine.is_operational()
+    machine.transition_to(ArmState.ERROR, "fault")
+    assert not machine.is_operational()
+    assert machine.get_error_message() == "fault"
+
+
+def test_hook_can_veto_transition():
+    machine = StateMachine()
+    machine.transition_to(ArmState.IDLE)
+    calls = []
+
+    def guard(previous, new_state):
+        calls.append((previous, new_state))
+        return False
+
+    machine.add_hook(ArmState.ACTIVE, guard)
+
+    assert not machine.transition_to(ArmState.ACTIVE)
+    assert machine.get_state() == ArmState.IDLE
+    assert calls == [(ArmState.IDLE, ArmState.ACTIVE)]
+    # Hooks only guard their own target state
+    assert machine.transition_to(ArmState.CALIBRATING)
+
+
+def test_listeners_are_notified_and_errors_contained():
+    machine = StateMachine()
+    seen = []
+
+    def broken(previous, new_state, error_message):
+        raise RuntimeError("listener bug")
+
+    machine.add_listener(broken)
+    machine.add_listener(lambda *transition: seen.append(transition))
+
+    assert machine.transition_to(ArmState.ERROR, "boom")
+    assert seen == [(ArmState.INITIALIZING, ArmState.ERROR, "boom")]
+
+    machine.remove_listener(broken)
+    machine.transition_to(ArmState.IDLE)
+    assert seen[-1] == (ArmState.ERROR, ArmState.IDLE, None)
+
+
+def test_history_is_bounded_and_timestamped():
+    clock = SimClock()
+    machine = StateMachine(history_size=2, clock=clock)
+
+    machine.transition_to(ArmState.IDLE)
+    clock.sleep(1.0)
+    machine.transition_to(ArmState.ACTIVE)
+    clock.sleep(1.0)
+    machine.transition_to(ArmState.IDLE)
+
+    history = machine.get_history()
+    assert [(frm, to) for _, frm, to in history] == [
+        (ArmState.IDLE, ArmState.ACTIVE),
+        (ArmState.ACTIVE, ArmState.IDLE),
+    ]
+    assert history[1][0] - history[0][0] == 1.0
+
+
+def test_syncs_trip_from_native_cell():
+    cell = SimStateCell()
+    machine = StateMachine(cell=cell)
+    machine.transition_to(ArmState.IDLE)
+    machine.transition_to(ArmState.ACTIVE)
+
+    assert cell.trip("Servo write failed: bus")
+
+    assert machine.get_state() == ArmState.ERROR
+    assert machine.get_error_message() == "Servo write failed: bus"
+    assert cell.get() == STATE_CODES[ArmState.ERROR]
+    # ERROR latches until explicitly recovered
+    assert not machine.transition_to(ArmState.ACTIVE)
@@ -12,7 +12,7 @@ def main():
     
     parser.add_argument(
         'mode',
-        choices=['demo', 'run', 'status', 'calibrate'],
+        choices=['demo', 'run', 'status', 'calibrate', 'pipeline', 'soak'],
         help='Operation mode'
     )
     
@@ -22,8 +22,88 @@ def main():
         help='Enable debug output'
     )
     
+    parser.add_argument(
+        '--cpu',
+        type=int,
+        help='Pin the control process to this core (pipeline mode)'
+    )
+    
+    parser.add_argument(
+        '--rt-priority',
+        type=int,
+        help='SCHED_FIFO priority for the control process (pipeline mode)'
+    )
+    
+    parser.add_argument(
+        '--dashboard',
+        action='store_true',
+        help='Serve the web dashboard from its own process (pipeline mode)'
+    )
+    
+    parser.add_argument(
+        '--record',
+        metavar='PATH',
+        help='Record telemetry to CSV from its own process (pipeline mode)'
+    )
+    
+    parser.add_argument(
+        '--hours',
+        type=float,
+        default=1.0,
+        help='Simulated hours to run (soak mode)'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Simulation seed (soak mode)'
+    )
+    
+    parser.add_argument(
+        '--sim-param',
+        action='append',
+        default=[],
+        metavar='NAME=VALUE',
+        help='Override a SimParams field, e.g. battery_capacity_ah=10 (soak mode, repeatable)'
+    )
+    
     args = parser.parse_args()
     
+    if args.mode == 'soak':
+        from application.simulation import SimParams, run_soak
+        
+        params = {}
+        for item in args.sim_param:
+            name, _, value = item.partition('=')
+            try:
+                params[name.strip()] = float(value)
+            except ValueError:
+                parser.error(f"--sim-param expects NAME=VALUE, got {item!r}")
+        try:
+            SimParams.from_overrides(params)
+        except ValueError as e:
+            parser.error(str(e))
+        
+        summary = run_soak(args.hours, seed=args.seed, params=params)
+        print("\n=== Soak Test ===")
+        for key, value in summary.items():
+            print(f"  {key}: {value}")
+        sys.exit(0 if summary['completed'] else 1)
+    
+    if args.mode == 'pipeline':
+        from application.pipeline import ArmPipeline
+        
+        pipeline = ArmPipeline(
+            cpu=args.cpu,
+            priority=args.rt_priority,
+            dashboard=args.dashboard,
+            record_path=args.record,
+        )
+        print("Starting pipeline. Press Ctrl+C to stop.")
+        pipeline.start()
+        sys.exit(0 if pipeline.wait() == 0 else 1)
+    
     controller = ArmController()
     
     if not controller.initialize():
@@ -42,6 +122,7 @@ def main():
         for key, value in status['bms'].items():
             print(f"  {key}: {value}")
         print(f"\nEMG Ready: {status['emg_ready']}")
+        print(f"Servo Positions: {status['servo_positions']}")
         print()
     elif args.mode == 'calibrate':
         print("Calibration mode not yet implemented")
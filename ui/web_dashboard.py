@@ -6,11 +6,28 @@ except ImportError:
     FLASK_AVAILABLE = False
     print("Flask not installed. Install with: pip install flask")
 
+import math
+import threading
+
 from application.hardware import HardwareInterface
+from application.grip_controller import GripType
+from application.state_machine import STATES
 
 if FLASK_AVAILABLE:
     app = Flask(__name__)
     hardware = None
+    
+    # Pipeline mode: status comes from the newest control-process telemetry
+    # record, handed over by publish_telemetry()
+    telemetry_mode = False
+    latest_record = None
+    telemetry_lock = threading.Lock()
+
+    def publish_telemetry(record):
+        """Replace the telemetry record served by /api/status"""
+        global latest_record
+        with telemetry_lock:
+            latest_record = record
 
     @app.route('/')
     def index():
@@ -35,6 +52,7 @@ if FLASK_AVAILABLE:
                     fetch('/api/status')
                         .then(r => r.json())
                         .then(data => {
+                            if (!data.bms) return;
                             document.getElementById('status').innerHTML = 
                                 '<div class="status ' + 
                                 (data.bms.is_healthy ? 'healthy' : 'error') + '">' +
@@ -57,9 +75,38 @@ if FLASK_AVAILABLE:
         </html>
         """
 
+    def telemetry_status() -> dict:
+        """Build a status payload from the newest telemetry record"""
+        with telemetry_lock:
+            record = latest_record
+        
+        if record is None:
+            return {'bms': None, 'emg_ready': False}
+        
+        (timestamp, state, grip, gesture, voltage, current,
+         temperature, charge_percentage, is_healthy, loop_time, emg_ready) = record
+        return {
+            'bms': None if math.isnan(voltage) else {
+                'voltage': voltage,
+                'current': current,
+                'temperature': temperature,
+                'is_healthy': bool(is_healthy),
+                'charge_percentage': charge_percentage,
+            },
+            'emg_ready': bool(emg_ready),
+            'state': STATES[int(state)].value,
+            'grip': list(GripType)[int(grip)].value,
+            'gesture': int(gesture),
+            'loop_time_ms': loop_time * 1000.0,
+            'timestamp': timestamp,
+        }
+
     @app.route('/api/status')
     def status():
         """API endpoint for status"""
+        if telemetry_mode:
+            return jsonify(telemetry_status())
+        
         global hardware
         if hardware is None:
             hardware = HardwareInterface()
@@ -67,13 +114,26 @@ if FLASK_AVAILABLE:
         
         return jsonify(hardware.get_status())
 
-    def run_dashboard(host='0.0.0.0', port=5000):
-        """Start the web dashboard"""
+    def run_dashboard(host='0.0.0.0', port=5000, telemetry=False):
+        """
+        Start the web dashboard
+        
+        Args:
+            host: Interface to bind
+            port: Port to listen on
+            telemetry: Serve records from publish_telemetry() instead of
+                opening the hardware directly (pipeline mode)
+        """
+        global telemetry_mode
+        telemetry_mode = telemetry
         print(f"Starting dashboard on http://{host}:{port}")
         app.run(host=host, port=port, debug=False)
 
 else:
-    def run_dashboard(host='0.0.0.0', port=5000):
+    def publish_telemetry(record):
+        pass
+
+    def run_dashboard(host='0.0.0.0', port=5000, telemetry=False):
         print("Flask not available. Cannot start dashboard.")
 
 